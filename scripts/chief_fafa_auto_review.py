@@ -17,6 +17,7 @@ import json
 import re
 import shutil
 import subprocess
+import sys
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -81,7 +82,7 @@ def add_video_host_hint(pipeline_path: Path, host_token: str) -> bool:
 def run_py_compile(py_file: Path) -> tuple[bool, str]:
     try:
         proc = subprocess.run(
-            ["/usr/bin/python3", "-m", "py_compile", str(py_file)],
+            [sys.executable or "/usr/bin/python3", "-m", "py_compile", str(py_file)],
             capture_output=True,
             text=True,
             timeout=30,
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import hashlib
 import io
 import json
 import mimetypes
@@ -22,13 +23,23 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+from concurrent.futures import Future
+from functools import lru_cache
 from html import unescape
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import parse_qsl, urljoin, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 REQUEST_TIMEOUT = 25
 OPENAI_REQUEST_TIMEOUT = 55
@@ -46,12 +57,17 @@ GOOGLE_DOC_URL_RE = re.compile(
     flags=re.IGNORECASE,
 )
 MAX_EMBED_IMAGE_BYTES = 8 * 1024 * 1024
+PAGE_CACHE_MAX_ENTRIES = 80
+DRIVE_PUBLIC_POLL_START_SEC = 0.05
+DRIVE_PUBLIC_POLL_MAX_SEC = 1.6
+DRIVE_PUBLIC_FINAL_MIN_WAIT_SEC = 1.0
 DOCS_SUPPORTED_IMAGE_MIME = {"image/jpeg", "image/png", "image/gif"}
 TRANSCRIPT_MAX_CHARS = 24000
 VIDEO_TEXT_MAX_CHARS = 24000
 TRANSCRIPT_MODEL = "gpt-4o-mini-transcribe"
 DOC_IMAGE_MARKER = "[[CHIEF_FAFA_IMAGE_HERE]]"
 URL_PATTERN = re.compile(r"https?://[^\s<>\"]+", flags=re.IGNORECASE)
+WHITESPACE_RE = re.compile(r"\s+")
 INLINE_INGREDIENT_STOP_PATTERN = re.compile(
     r"(?:\b(?:instructions?|method|steps?|directions?)\b|做法|作法|手順|作り方|https?://|#\w)",
     flags=re.IGNORECASE,
@@ -67,6 +83,10 @@ INGREDIENT_PLACEHOLDER_PATTERN = re.compile(
     r"^(?:not clearly detected from source\.?|see source url for full ingredients list\.?|n/a|none|tbd)$",
     flags=re.IGNORECASE,
 )
+# Shared keep-alive session: every Google/OpenAI/source call reuses pooled TLS connections per host.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+HTTP_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
 
 VIDEO_URL_HINTS = [
     "youtube.com",
@@ -223,32 +243,41 @@ ENV_FALLBACK_FILES = [
 ]
 
 
+def parse_env_file(env_file: Path) -> Dict[str, str]:
+    # First non-empty value per key wins.
+    values: Dict[str, str] = {}
+    try:
+        text = env_file.read_text(encoding="utf-8")
+    except Exception:
+        return values
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, raw_val = line.split("=", 1)
+        key = key.strip()
+        cleaned = raw_val.strip().strip("'\"")
+        if cleaned and key not in values:
+            values[key] = cleaned
+    return values
+
+
+@lru_cache(maxsize=1)
+def env_file_values() -> Dict[str, str]:
+    # Read and merge every fallback file once per run; earlier files win, matching lookup order.
+    merged: Dict[str, str] = {}
+    for env_file in ENV_FALLBACK_FILES:
+        for key, value in parse_env_file(env_file).items():
+            merged.setdefault(key, value)
+    return merged
+
+
 def read_env_value(name: str, default: str = "") -> str:
     value = os.getenv(name, "").strip()
     if value:
         return value
 
-    for env_file in ENV_FALLBACK_FILES:
-        try:
-            if not env_file.exists():
-                continue
-        except OSError:
-            continue
-        try:
-            for raw_line in env_file.read_text(encoding="utf-8").splitlines():
-                line = raw_line.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                key, raw_val = line.split("=", 1)
-                if key.strip() != name:
-                    continue
-                cleaned = raw_val.strip().strip("'\"")
-                if cleaned:
-                    return cleaned
-        except Exception:
-            continue
-
-    return default
+    return env_file_values().get(name, default)
 
 
 def env_flag(name: str, default: bool = False) -> bool:
@@ -265,11 +294,54 @@ def is_fast_mode_enabled() -> bool:
 
 
 def normalize_space(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    return WHITESPACE_RE.sub(" ", text).strip()
 
 
 def decode_html_text(text: str) -> str:
-    return normalize_space(unescape(text or ""))
+    text = text or ""
+    if "&" not in text:
+        return normalize_space(text)
+    return normalize_space(unescape(text))
+
+
+def dict_text(data: Dict[str, Any], key: str, default: str = "") -> str:
+    value = data.get(key, default)
+    if isinstance(value, str):
+        return value.strip()
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def dedupe_messages(items: Iterable[Any]) -> List[str]:
+    # dict.fromkeys keeps first-seen order while dropping repeats.
+    return list(dict.fromkeys(msg for msg in (normalize_space(str(x)) for x in items) if msg))
+
+
+def start_background_task(fn: Any, *args: Any) -> Future:
+    # Daemon thread, not an executor worker: an abandoned prefetch must not hold the process open at exit.
+    future: Future = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def truncate_with_ellipsis(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    # Walk back over trailing whitespace instead of slicing and then rstrip-ing a copy.
+    cut = max_chars - 3
+    while cut > 0 and text[cut - 1].isspace():
+        cut -= 1
+    return text[:cut] + "..."
 
 
 def normalize_multiline_text(text: str) -> str:
@@ -296,6 +368,8 @@ COMMENT_BODY_RE = re.compile(
     r"(?:thanks for sharing|great post|anonymous said|留下評論|发表留言)",
     flags=re.IGNORECASE,
 )
+COMMENT_ANONYMOUS_RE = re.compile(r"(?:匿名|anonymous)", flags=re.IGNORECASE)
+COMMENT_ACTION_RE = re.compile(r"(?:reply|delete|回覆|回复|刪除|删除)", flags=re.IGNORECASE)
 
 
 def is_comment_or_social_line(text: str) -> bool:
@@ -308,9 +382,9 @@ def is_comment_or_social_line(text: str) -> bool:
         return True
     if COMMENT_BODY_RE.search(clean):
         return True
-    if re.fullmatch(r"(?:匿名|anonymous)", clean, flags=re.IGNORECASE):
+    if COMMENT_ANONYMOUS_RE.fullmatch(clean):
         return True
-    if re.fullmatch(r"(?:reply|delete|回覆|回复|刪除|删除)", clean, flags=re.IGNORECASE):
+    if COMMENT_ACTION_RE.fullmatch(clean):
         return True
     return False
 
@@ -324,21 +398,23 @@ def is_comment_section_start_line(text: str) -> bool:
     return bool(COMMENT_SECTION_START_RE.search(clean))
 
 
+COMMENT_SECTION_HTML_MARKERS = [
+    re.compile(r"<div[^>]+id=[\"']comments[\"']", flags=re.IGNORECASE),
+    re.compile(r"<div[^>]+class=[\"'][^\"']*comments[^\"']*[\"']", flags=re.IGNORECASE),
+    re.compile(r"<a[^>]+name=[\"']comments[\"']", flags=re.IGNORECASE),
+    re.compile(r"<h[1-6][^>]*>\s*comments?\s*</h[1-6]>", flags=re.IGNORECASE),
+    re.compile(r"發佈留言"),
+    re.compile(r"发表评论"),
+]
+
+
 def strip_comment_sections_html(html: str) -> str:
     raw = str(html or "")
     if not raw:
         return raw
-    start_markers = [
-        r"<div[^>]+id=[\"']comments[\"']",
-        r"<div[^>]+class=[\"'][^\"']*comments[^\"']*[\"']",
-        r"<a[^>]+name=[\"']comments[\"']",
-        r"<h[1-6][^>]*>\s*comments?\s*</h[1-6]>",
-        r"發佈留言",
-        r"发表评论",
-    ]
     cut_positions: List[int] = []
-    for marker in start_markers:
-        m = re.search(marker, raw, flags=re.IGNORECASE)
+    for marker in COMMENT_SECTION_HTML_MARKERS:
+        m = marker.search(raw)
         if m:
             cut_positions.append(m.start())
     if cut_positions:
@@ -346,52 +422,79 @@ def strip_comment_sections_html(html: str) -> str:
     return raw
 
 
+LINE_BULLET_PREFIX_RE = re.compile(r"^\s*[-*•●▪■★☆※]+\s*")
+LINE_NUMBER_PREFIX_RE = re.compile(r"^\s*\(?\d{1,3}\)?[.)、:：]\s+")
+LEADING_HASHTAG_RE = re.compile(r"(?:^|\s)#\S+")
+HASHTAG_RE = re.compile(r"#\S+")
+QTY_UNIT_TOKEN_RE = re.compile(
+    r"\d+(?:\.\d+)?\s*(?:kg|g|mg|ml|l|cc|oz|lb|lbs|tbsp|tsp|cups?|pcs?|pc|克|公斤|毫升|公升|茶匙|湯匙|汤匙|大匙|小匙|條|条|隻|只|個|个|片|塊|块|顆|颗|粒)",
+    flags=re.IGNORECASE,
+)
+LATIN_CHAR_RE = re.compile(r"[A-Za-z]")
+CJK_CHAR_RE = re.compile(r"[\u3400-\u9fff]")
+INLINE_NAME_LEAD_PUNCT_RE = re.compile(r"^[\s:：,，;；.\-–—()（）\[\]]+")
+INLINE_NAME_HEADING_WORD_RE = re.compile(r"\b(?:ingredients?|material)\b", flags=re.IGNORECASE)
+INLINE_NAME_HEADING_TAIL_RE = re.compile(r"(?:材料|食材)\s*$")
+INLINE_NAME_LEAD_NOTE_RE = re.compile(r"^\([^)]*\)\s*")
+INLINE_STAR_SPLIT_RE = re.compile(r"\s*\*\s*")
+INLINE_BULLET_SPLIT_RE = re.compile(r"[•●▪■★☆※]\s*")
+STEP_NUMBER_SPLIT_RE = re.compile(r"(?=(?:^|\s)(?:\d{1,2}|[一二三四五六七八九十])[\.、\):：])")
+STEP_NUMBER_PREFIX_RE = re.compile(r"^\s*(\d{1,2}|[一二三四五六七八九十])[\.、\):：]")
+INGREDIENT_QTY_RE = re.compile(
+    r"(\d+(\.\d+)?\s*(g|kg|ml|l|tbsp|tsp|cup|cups|oz|lb|pcs|pc|片|隻|只|個|克|公斤|毫升|茶匙|汤匙|湯匙|大さじ|小さじ|컵|큰술|작은술|그램|개))"
+)
+SCRIPT_BLOCK_RE = re.compile(r"<script[^>]*>.*?</script>", flags=re.IGNORECASE | re.DOTALL)
+STYLE_BLOCK_RE = re.compile(r"<style[^>]*>.*?</style>", flags=re.IGNORECASE | re.DOTALL)
+BR_TAG_RE = re.compile(r"<br\s*/?>", flags=re.IGNORECASE)
+BLOCK_CLOSE_TAG_RE = re.compile(r"</(p|li|h[1-6]|div|tr|ul|ol|section|article|header|footer)>", flags=re.IGNORECASE)
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+BARE_URL_RE = re.compile(r"https?://\S+")
+
+
 def unique_clean_lines(items: Iterable[str], max_items: int = 220) -> List[str]:
-    seen: set[str] = set()
-    out: List[str] = []
+    # Keyed by casefold, first spelling wins; dict insertion order keeps the output order.
+    out: Dict[str, str] = {}
     for item in items:
         line = decode_html_text(item)
-        line = re.sub(r"^\s*[-*•●▪■★☆※]+\s*", "", line).strip()
-        line = re.sub(r"^\s*\(?\d{1,3}\)?[.)、:：]\s+", "", line).strip()
+        line = LINE_BULLET_PREFIX_RE.sub("", line).strip()
+        line = LINE_NUMBER_PREFIX_RE.sub("", line).strip()
         if len(line) < 2:
             continue
+        key = line.casefold()
+        if key in out:
+            continue
         if is_comment_or_social_line(line):
             continue
         if INGREDIENT_PLACEHOLDER_PATTERN.fullmatch(line):
             continue
-        if re.search(r"(?:^|\s)#\S+", line) and len(re.findall(r"#\S+", line)) >= 2:
+        if "#" in line and LEADING_HASHTAG_RE.search(line) and len(HASHTAG_RE.findall(line)) >= 2:
             continue
         # Skip merged bilingual ingredient lines when they contain multiple qty+unit tokens.
-        qty_hits = re.findall(
-            r"\d+(?:\.\d+)?\s*(?:kg|g|mg|ml|l|cc|oz|lb|lbs|tbsp|tsp|cups?|pcs?|pc|克|公斤|毫升|公升|茶匙|湯匙|汤匙|大匙|小匙|條|条|隻|只|個|个|片|塊|块|顆|颗|粒)",
-            line,
-            flags=re.IGNORECASE,
-        )
-        if len(qty_hits) >= 2 and re.search(r"[A-Za-z]", line) and re.search(r"[\u3400-\u9fff]", line):
+        if (
+            len(QTY_UNIT_TOKEN_RE.findall(line)) >= 2
+            and LATIN_CHAR_RE.search(line)
+            and CJK_CHAR_RE.search(line)
+        ):
             continue
-        if line.lower().startswith(("http://", "https://")):
+        if key.startswith(("http://", "https://")):
             continue
-        key = line.casefold()
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(line)
+        out[key] = line
         if len(out) >= max_items:
             break
-    return out
+    return list(out.values())
 
 
 def normalize_inline_ingredient_name(text: str) -> str:
     out = normalize_space(unescape(text or ""))
-    out = re.sub(r"^[\s:：,，;；.\-–—()（）\[\]]+", "", out)
-    out = re.sub(r"\b(?:ingredients?|material)\b", "", out, flags=re.IGNORECASE).strip()
-    out = re.sub(r"(?:材料|食材)\s*$", "", out).strip()
+    out = INLINE_NAME_LEAD_PUNCT_RE.sub("", out)
+    out = INLINE_NAME_HEADING_WORD_RE.sub("", out).strip()
+    out = INLINE_NAME_HEADING_TAIL_RE.sub("", out).strip()
     # If a leading note leaks before ")", keep the token after the last ")"
     if ")" in out:
         tail = out.split(")")[-1].strip()
         if tail:
             out = tail
-    out = re.sub(r"^\([^)]*\)\s*", "", out).strip()
+    out = INLINE_NAME_LEAD_NOTE_RE.sub("", out).strip()
     return out
 
 
@@ -400,7 +503,7 @@ def extract_inline_ingredient_items(text: str, max_items: int = 120) -> List[str
     if not clean:
         return []
     clean = URL_PATTERN.sub(" ", clean)
-    clean = re.sub(r"#\S+", " ", clean)
+    clean = HASHTAG_RE.sub(" ", clean)
     clean = normalize_space(clean)
     if not clean:
         return []
@@ -438,12 +541,7 @@ def extract_inline_ingredient_items(text: str, max_items: int = 120) -> List[str
 
 def extract_inline_ingredient_segment(text_blob: str) -> str:
     raw = unescape(text_blob or "")
-    ing_kw = heading_keywords_pattern(INGREDIENT_HEADING_KEYWORDS)
-    m = re.search(
-        rf"(?:{ing_kw})(?:\s*[\(\[（【].{{0,40}}?[\)\]）】])?\s*[:：]?\s*(.+)$",
-        raw,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
+    m = keyword_section_regexes()[0].search(raw)
     if not m:
         return ""
     tail = normalize_space(m.group(1) or "")
@@ -457,8 +555,8 @@ def split_ingredient_candidates(text: str) -> List[str]:
     raw = unescape(text or "")
     raw = raw.replace("\r\n", "\n").replace("\r", "\n")
     raw = raw.replace("\u00a0", " ").replace("\u3000", " ")
-    raw = re.sub(r"\s*\*\s*", "\n", raw)
-    raw = re.sub(r"[•●▪■★☆※]\s*", "\n", raw)
+    raw = INLINE_STAR_SPLIT_RE.sub("\n", raw)
+    raw = INLINE_BULLET_SPLIT_RE.sub("\n", raw)
     parts = [normalize_space(p) for p in raw.split("\n") if normalize_space(p)]
     if "\n" in raw:
         return parts
@@ -479,7 +577,7 @@ def split_step_candidates(text: str) -> List[str]:
         part = normalize_space(part)
         if not part:
             continue
-        numbered = re.split(r"(?=(?:^|\s)(?:\d{1,2}|[一二三四五六七八九十])[\.、\):：])", part)
+        numbered = STEP_NUMBER_SPLIT_RE.split(part)
         if len(numbered) > 1:
             for item in numbered:
                 item = normalize_space(item)
@@ -490,13 +588,16 @@ def split_step_candidates(text: str) -> List[str]:
     return chunks
 
 
-def html_to_text_lines(html: str) -> List[str]:
-    html = strip_comment_sections_html(html)
-    text = re.sub(r"<script[^>]*>.*?</script>", " ", html, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r"<style[^>]*>.*?</style>", " ", text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r"<br\s*/?>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"</(p|li|h[1-6]|div|tr|ul|ol|section|article|header|footer)>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", " ", text)
+def scrub_html_for_text(html: str) -> str:
+    text = strip_comment_sections_html(html)
+    text = SCRIPT_BLOCK_RE.sub(" ", text)
+    return STYLE_BLOCK_RE.sub(" ", text)
+
+
+def html_to_text_lines(scrubbed_html: str) -> List[str]:
+    text = BR_TAG_RE.sub("\n", scrubbed_html)
+    text = BLOCK_CLOSE_TAG_RE.sub("\n", text)
+    text = HTML_TAG_RE.sub(" ", text)
     text = unescape(text)
     text = text.replace("\u00a0", " ")
     lines = [normalize_space(x) for x in text.splitlines()]
@@ -524,54 +625,88 @@ def is_heading_line(line: str, keywords: List[str]) -> bool:
     return any(k in low for k in keywords)
 
 
-def heading_keywords_pattern(keywords: List[str]) -> str:
+def heading_keywords_pattern(keywords: Iterable[str]) -> str:
     ordered = sorted({k for k in keywords if k}, key=len, reverse=True)
     if not ordered:
         return r"(?:)"
     return "(?:" + "|".join(re.escape(k) for k in ordered) + ")"
 
 
-def is_heading_start_line(line: str, keywords: List[str]) -> bool:
+# Heading regexes are rebuilt from fixed keyword lists on every line; compile each once.
+@lru_cache(maxsize=32)
+def heading_start_regex(keywords: Tuple[str, ...]) -> "re.Pattern[str]":
     patt = heading_keywords_pattern(keywords)
-    return bool(
-        re.search(
-            rf"^\s*(?:[-*•●▪■★☆※]\s*)?{patt}(?:\s*[\(\[（【].{{0,40}}?[\)\]）】])?\s*(?:[:：]|$)",
-            line,
-            flags=re.IGNORECASE,
-        )
+    return re.compile(
+        rf"^\s*(?:[-*•●▪■★☆※]\s*)?{patt}(?:\s*[\(\[（【].{{0,40}}?[\)\]）】])?\s*(?:[:：]|$)",
+        flags=re.IGNORECASE,
     )
 
 
-def heading_inline_tail(line: str, keywords: List[str]) -> str:
+@lru_cache(maxsize=32)
+def heading_tail_regex(keywords: Tuple[str, ...]) -> "re.Pattern[str]":
     patt = heading_keywords_pattern(keywords)
-    m = re.search(
+    return re.compile(
         rf"^\s*(?:[-*•●▪■★☆※]\s*)?{patt}(?:\s*[\(\[（【].{{0,40}}?[\)\]）】])?\s*(?:[:：]|[-—–])?\s*(.*)$",
-        line,
         flags=re.IGNORECASE,
     )
+
+
+HEADING_ALIAS_ONLY_RE = re.compile(r"[\(\[（【].{0,40}[\)\]）】]")
+
+
+@lru_cache(maxsize=1)
+def keyword_section_regexes() -> Tuple["re.Pattern[str]", ...]:
+    # Built from the fixed heading keyword lists, so compile once: inline ingredient segment,
+    # ingredient block, method block, and the terminal-section split.
+    ing_kw = heading_keywords_pattern(INGREDIENT_HEADING_KEYWORDS)
+    method_kw = heading_keywords_pattern(METHOD_HEADING_KEYWORDS)
+    stop_kw = heading_keywords_pattern(STOP_SECTION_KEYWORDS)
+    return (
+        re.compile(
+            rf"(?:{ing_kw})(?:\s*[\(\[（【].{{0,40}}?[\)\]）】])?\s*[:：]?\s*(.+)$",
+            flags=re.IGNORECASE | re.DOTALL,
+        ),
+        re.compile(
+            rf"(?:{ing_kw})(?:\s*[\(\[（【].{{0,40}}?[\)\]）】])?\s*[:：]\s*(.+?)(?:(?:{method_kw})(?:\s*[\(\[（【].{{0,40}}?[\)\]）】])?\s*[:：]|$)",
+            flags=re.IGNORECASE | re.DOTALL,
+        ),
+        re.compile(
+            rf"(?:{method_kw})(?:\s*[\(\[（【].{{0,40}}?[\)\]）】])?\s*[:：]\s*(.+)",
+            flags=re.IGNORECASE | re.DOTALL,
+        ),
+        re.compile(
+            rf"(?:\n\s*(?:{stop_kw})(?:\s*[\(\[（【].{{0,40}}?[\)\]）】])?\s*[:：])",
+            flags=re.IGNORECASE,
+        ),
+    )
+
+
+def is_heading_start_line(line: str, keywords: List[str]) -> bool:
+    return bool(heading_start_regex(tuple(keywords)).search(line))
+
+
+def heading_inline_tail(line: str, keywords: List[str]) -> str:
+    m = heading_tail_regex(tuple(keywords)).search(line)
     if not m:
         return ""
     tail = normalize_space(m.group(1) or "")
     if not tail:
         return ""
     # Treat pure heading aliases as empty tails.
-    if re.fullmatch(r"[\(\[（【].{0,40}[\)\]）】]", tail):
+    if HEADING_ALIAS_ONLY_RE.fullmatch(tail):
         return ""
     return tail
 
 
 def looks_like_ingredient_line(line: str) -> bool:
     low = line.casefold()
-    if re.search(r"(?:^|\s)#\S+", line) and len(re.findall(r"#\S+", line)) >= 2:
+    if LEADING_HASHTAG_RE.search(line) and len(HASHTAG_RE.findall(line)) >= 2:
         return False
     if any(token in low for token in ["facebook", "instagram", "youtube", "wechat", "contact", "email"]):
         return False
     if any(k in low for k in INGREDIENT_HEADING_KEYWORDS):
         return False
-    if re.search(
-        r"(\d+(\.\d+)?\s*(g|kg|ml|l|tbsp|tsp|cup|cups|oz|lb|pcs|pc|片|隻|只|個|克|公斤|毫升|茶匙|汤匙|湯匙|大さじ|小さじ|컵|큰술|작은술|그램|개))",
-        low,
-    ):
+    if INGREDIENT_QTY_RE.search(low):
         return True
     if any(x in low for x in ["適量", "适量", "to taste", "少許", "少许"]):
         return True
@@ -581,7 +716,7 @@ def looks_like_ingredient_line(line: str) -> bool:
 
 
 def looks_like_step_line(line: str) -> bool:
-    if re.match(r"^\s*(\d{1,2}|[一二三四五六七八九十])[\.、\):：]", line):
+    if STEP_NUMBER_PREFIX_RE.match(line):
         return True
     if len(line) >= 18:
         return True
@@ -651,35 +786,20 @@ def extract_sections_by_regex(text_blob: str) -> Tuple[List[str], List[str]]:
     ingredients: List[str] = []
     steps: List[str] = []
 
-    ing_kw = heading_keywords_pattern(INGREDIENT_HEADING_KEYWORDS)
-    method_kw = heading_keywords_pattern(METHOD_HEADING_KEYWORDS)
-    stop_kw = heading_keywords_pattern(STOP_SECTION_KEYWORDS)
+    _, ingredient_block_re, method_block_re, stop_section_re = keyword_section_regexes()
 
-    ingredient_match = re.search(
-        rf"(?:{ing_kw})(?:\s*[\(\[（【].{{0,40}}?[\)\]）】])?\s*[:：]\s*(.+?)(?:(?:{method_kw})(?:\s*[\(\[（【].{{0,40}}?[\)\]）】])?\s*[:：]|$)",
-        low_blob,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
+    ingredient_match = ingredient_block_re.search(low_blob)
     if ingredient_match:
         block = ingredient_match.group(1)
         for part in split_ingredient_candidates(block):
             if looks_like_ingredient_line(part) and not is_comment_or_social_line(part):
                 ingredients.append(part)
 
-    method_match = re.search(
-        rf"(?:{method_kw})(?:\s*[\(\[（【].{{0,40}}?[\)\]）】])?\s*[:：]\s*(.+)",
-        low_blob,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
+    method_match = method_block_re.search(low_blob)
     if method_match:
         block = method_match.group(1)
         # stop at common terminal sections if present
-        stop = re.split(
-            rf"(?:\n\s*(?:{stop_kw})(?:\s*[\(\[（【].{{0,40}}?[\)\]）】])?\s*[:：])",
-            block,
-            maxsplit=1,
-            flags=re.IGNORECASE,
-        )[0]
+        stop = stop_section_re.split(block, maxsplit=1)[0]
         for part in split_step_candidates(stop):
             if looks_like_step_line(part) and not is_comment_or_social_line(part):
                 steps.append(part)
@@ -716,9 +836,12 @@ def extract_recipe_sections_from_text_blob(text_blob: str) -> Tuple[List[str], L
     return ingredients, steps
 
 
+SUPPORTED_IMAGE_EXT_RE = re.compile(r"\.(jpg|jpeg|png|gif)(?:$|\?)", flags=re.IGNORECASE)
+
+
 def thumbnail_from_video_metadata(meta: Dict[str, Any]) -> str:
     thumb = str(meta.get("thumbnail", "")).strip()
-    if thumb and re.search(r"\.(jpg|jpeg|png|gif)(?:$|\?)", thumb, flags=re.IGNORECASE):
+    if thumb and SUPPORTED_IMAGE_EXT_RE.search(thumb):
         return thumb
     thumbs = meta.get("thumbnails")
     if isinstance(thumbs, list):
@@ -733,7 +856,7 @@ def thumbnail_from_video_metadata(meta: Dict[str, Any]) -> str:
             if not url:
                 continue
             height = int(item.get("height", 0) or 0)
-            is_supported = bool(re.search(r"\.(jpg|jpeg|png|gif)(?:$|\?)", url, flags=re.IGNORECASE))
+            is_supported = bool(SUPPORTED_IMAGE_EXT_RE.search(url))
             if is_supported and height > preferred_h:
                 preferred_h = height
                 preferred = url
@@ -811,8 +934,7 @@ def normalize_title_for_chat(text: str) -> str:
             if len(left) >= 10:
                 title = left
                 break
-    if len(title) > 120:
-        title = title[:117].rstrip() + "..."
+    title = truncate_with_ellipsis(title, 120)
     return title
 
 
@@ -880,12 +1002,17 @@ def title_segment_score(segment: str, target: str) -> float:
     return 0.0
 
 
+TRAILING_HASHTAGS_RE = re.compile(r"(?:\s*#\S+){2,}$")
+MULTI_SPACE_RE = re.compile(r"\s{2,}")
+TRAILING_TITLE_PUNCT_RE = re.compile(r"[:：|/·\-\u2014]+$")
+
+
 def cleanup_title_text(text: str) -> str:
     title = decode_html_text(text)
-    title = re.sub(r"https?://\S+", "", title).strip()
-    title = re.sub(r"(?:\s*#\S+){2,}$", "", title).strip()
-    title = re.sub(r"\s{2,}", " ", title).strip()
-    title = re.sub(r"[:：|/·\-\u2014]+$", "", title).strip()
+    title = BARE_URL_RE.sub("", title).strip()
+    title = TRAILING_HASHTAGS_RE.sub("", title).strip()
+    title = MULTI_SPACE_RE.sub(" ", title).strip()
+    title = TRAILING_TITLE_PUNCT_RE.sub("", title).strip()
     return title
 
 
@@ -908,21 +1035,26 @@ def title_looks_generic(title: str) -> bool:
     return False
 
 
+TRAILING_HASHTAG_RUN_RE = re.compile(r"(?:\s*#\S+)+$")
+TITLE_EMOJI_SPLIT_RE = re.compile(r"[💖💕❤️✨⭐️🌟🟡🟠🟢🔴🔵🟣✅❌❣️✿]")
+TITLE_SEGMENT_SPLIT_RE = re.compile(r"[|/｜／]")
+
+
 def derive_title_from_text(text: str) -> str:
     raw = decode_html_text(text)
-    raw = re.sub(r"https?://\S+", "", raw)
+    raw = BARE_URL_RE.sub("", raw)
     lines = [normalize_space(x) for x in raw.splitlines() if normalize_space(x)]
     if not lines:
         return ""
     for line in lines[:10]:
-        candidate = re.sub(r"(?:\s*#\S+)+$", "", line).strip()
+        candidate = TRAILING_HASHTAG_RUN_RE.sub("", line).strip()
         candidate = candidate.strip(" -|·/:\t")
-        candidate = re.split(r"[💖💕❤️✨⭐️🌟🟡🟠🟢🔴🔵🟣✅❌❣️✿]", candidate, maxsplit=1)[0].strip()
+        candidate = TITLE_EMOJI_SPLIT_RE.split(candidate, maxsplit=1)[0].strip()
         if len(candidate) < 6:
             continue
         if candidate.casefold().startswith(("ingredients", "method", "directions", "steps", "做法", "材料")):
             continue
-        segs = [cleanup_title_text(x) for x in re.split(r"[|/｜／]", candidate) if cleanup_title_text(x)]
+        segs = [cleanup_title_text(x) for x in TITLE_SEGMENT_SPLIT_RE.split(candidate) if cleanup_title_text(x)]
         cjk_segs = []
         for seg in segs:
             p = script_profile(seg)
@@ -963,6 +1095,9 @@ def filter_title_tokens_by_script(title: str, target: str) -> str:
     return out
 
 
+TITLE_PART_SPLIT_RE = re.compile(r"\s(?:\||-|·|/|\u2014)\s|[|/]\s*|:\s+")
+
+
 def refine_title_for_content_language(title: str, context_text: str) -> str:
     clean_title = cleanup_title_text(title)
     if not clean_title:
@@ -971,7 +1106,7 @@ def refine_title_for_content_language(title: str, context_text: str) -> str:
     if target == "unknown":
         return clean_title
 
-    raw_parts = re.split(r"\s(?:\||-|·|/|\u2014)\s|[|/]\s*|:\s+", clean_title)
+    raw_parts = TITLE_PART_SPLIT_RE.split(clean_title)
     parts = [cleanup_title_text(p) for p in raw_parts if cleanup_title_text(p)]
     if not parts:
         return clean_title
@@ -995,6 +1130,10 @@ def refine_title_for_content_language(title: str, context_text: str) -> str:
     return clean_title
 
 
+UNCLOSED_PAREN_TAIL_RE = re.compile(r"\([^()]*$")
+TRAILING_CLAUSE_PUNCT_RE = re.compile(r"[:：;,\-]+$")
+
+
 def strip_diagnostic_suffix(text: str) -> str:
     cleaned = decode_html_text(text)
     cleaned = normalize_space(cleaned)
@@ -1014,8 +1153,8 @@ def strip_diagnostic_suffix(text: str) -> str:
     if cut_idx >= 0:
         cleaned = cleaned[:cut_idx]
 
-    cleaned = re.sub(r"\([^()]*$", "", cleaned).strip()
-    cleaned = re.sub(r"[:：;,\-]+$", "", cleaned).strip()
+    cleaned = UNCLOSED_PAREN_TAIL_RE.sub("", cleaned).strip()
+    cleaned = TRAILING_CLAUSE_PUNCT_RE.sub("", cleaned).strip()
     return normalize_space(cleaned)
 
 
@@ -1078,8 +1217,7 @@ def sanitize_doc_text_block(text: str, max_chars: int) -> str:
         return ""
     cleaned = "\n".join(kept)
     cleaned = strip_diagnostic_suffix(cleaned)
-    if len(cleaned) > max_chars:
-        cleaned = cleaned[: max_chars - 3].rstrip() + "..."
+    cleaned = truncate_with_ellipsis(cleaned, max_chars)
     return cleaned
 
 
@@ -1112,7 +1250,7 @@ def short_chat_summary(source: Dict[str, Any], formats: Dict[str, str], source_e
     domain = urlparse(url).netloc.lower()
     title = normalize_title_for_chat(str(source.get("title", ""))) or "Untitled recipe"
     ai_summary = decode_html_text(str(formats.get("summary", "")))
-    ai_summary = re.sub(r"https?://\S+", "", ai_summary).strip()
+    ai_summary = BARE_URL_RE.sub("", ai_summary).strip()
     ai_summary = strip_diagnostic_suffix(ai_summary)
 
     ingredients = [decode_html_text(str(x)) for x in source.get("ingredients", []) if str(x).strip()]
@@ -1157,8 +1295,7 @@ def short_chat_summary(source: Dict[str, Any], formats: Dict[str, str], source_e
     if source_error:
         summary = f"Source crawl failed; generated fallback content. {summary}"
     summary = normalize_space(summary)
-    if len(summary) > 220:
-        summary = summary[:217].rstrip() + "..."
+    summary = truncate_with_ellipsis(summary, 220)
     return summary
 
 
@@ -1190,8 +1327,7 @@ def decorate_summary_with_attempt_status(
         out = f"{out} Self-improve review triggered."
 
     out = normalize_space(out)
-    if len(out) > 220:
-        out = out[:217].rstrip() + "..."
+    out = truncate_with_ellipsis(out, 220)
     return out
 
 
@@ -1199,18 +1335,18 @@ def human_readable_doc_summary(source: Dict[str, Any], formats: Dict[str, str])
     title = normalize_title_for_chat(str(source.get("title", ""))) or "Untitled recipe"
     description = decode_html_text(str(source.get("description", "")))
     description = normalize_space(description)
-    description = re.sub(r"https?://\S+", "", description).strip()
+    description = BARE_URL_RE.sub("", description).strip()
     description = strip_diagnostic_suffix(description)
     video_description = decode_html_text(str(source.get("video_description", "")))
     video_description = normalize_space(video_description)
-    video_description = re.sub(r"https?://\S+", "", video_description).strip()
+    video_description = BARE_URL_RE.sub("", video_description).strip()
     video_description = strip_diagnostic_suffix(video_description)
     transcript = decode_html_text(str(source.get("video_transcript", "")))
     transcript = normalize_space(transcript)
     transcript = strip_diagnostic_suffix(transcript)
 
     ai_summary = decode_html_text(str(formats.get("summary", "")))
-    ai_summary = re.sub(r"https?://\S+", "", ai_summary).strip()
+    ai_summary = BARE_URL_RE.sub("", ai_summary).strip()
     ai_summary = strip_diagnostic_suffix(ai_summary)
 
     preferred = ai_summary if len(ai_summary) >= 18 else ""
@@ -1227,8 +1363,7 @@ def human_readable_doc_summary(source: Dict[str, Any], formats: Dict[str, str])
         else:
             preferred = f"{title}. Recipe extracted from the source page."
 
-    if len(preferred) > 600:
-        preferred = preferred[:597].rstrip() + "..."
+    preferred = truncate_with_ellipsis(preferred, 600)
     return preferred
 
 
@@ -1261,13 +1396,17 @@ def extract_first_url(text: str) -> str:
     return url
 
 
+ENQUIRY_LATIN_TERM_RE = re.compile(r"[a-z0-9][a-z0-9\-]{1,30}")
+ENQUIRY_CJK_TERM_RE = re.compile(r"[\u3400-\u9fff\u3040-\u30ff\uac00-\ud7af]{2,16}")
+
+
 def extract_enquiry_terms(text: str, max_terms: int = 8) -> List[str]:
     clean = decode_html_text(text).casefold()
     if not clean:
         return []
 
-    latin_terms = re.findall(r"[a-z0-9][a-z0-9\-]{1,30}", clean)
-    cjk_terms = re.findall(r"[\u3400-\u9fff\u3040-\u30ff\uac00-\ud7af]{2,16}", clean)
+    latin_terms = ENQUIRY_LATIN_TERM_RE.findall(clean)
+    cjk_terms = ENQUIRY_CJK_TERM_RE.findall(clean)
     merged = latin_terms + cjk_terms
     out: List[str] = []
     seen: set[str] = set()
@@ -1338,6 +1477,10 @@ def looks_like_structured_recipe_text(text: str) -> bool:
     return False
 
 
+ENQUIRY_ACTION_RE = re.compile(r"\b(find|search|lookup|look up|show|list)\b")
+ENQUIRY_CONTEXT_RE = re.compile(r"\b(recipe|recipes|saved|history|previous|old)\b")
+
+
 def looks_like_recipe_enquiry(text: str) -> bool:
     raw = unescape(str(text or "")).strip()
     if not raw:
@@ -1350,8 +1493,8 @@ def looks_like_recipe_enquiry(text: str) -> bool:
     low = clean.casefold()
     has_keyword = any(k in low for k in ENQUIRY_KEYWORDS)
     if not has_keyword:
-        has_action = bool(re.search(r"\b(find|search|lookup|look up|show|list)\b", low))
-        has_recipe_context = bool(re.search(r"\b(recipe|recipes|saved|history|previous|old)\b", low))
+        has_action = bool(ENQUIRY_ACTION_RE.search(low))
+        has_recipe_context = bool(ENQUIRY_CONTEXT_RE.search(low))
         has_keyword = has_action and has_recipe_context
     has_question = ("?" in clean) or ("？" in clean)
     return has_keyword or has_question
@@ -1401,6 +1544,9 @@ def extract_doc_urls_from_text(text: str) -> List[str]:
     return out
 
 
+GOOGLE_DOC_ID_RE = re.compile(r"[A-Za-z0-9_-]{20,}")
+
+
 def extract_google_doc_id(value: str) -> str:
     raw = str(value or "").strip()
     if not raw:
@@ -1408,7 +1554,7 @@ def extract_google_doc_id(value: str) -> str:
     m = GOOGLE_DOC_URL_RE.search(raw)
     if m:
         return str(m.group(1) or "").strip()
-    if re.fullmatch(r"[A-Za-z0-9_-]{20,}", raw):
+    if GOOGLE_DOC_ID_RE.fullmatch(raw):
         return raw
     return ""
 
@@ -1447,13 +1593,13 @@ def validate_google_doc_url(
 
     params = {"fields": "id,mimeType,trashed,webViewLink"}
     try:
-        resp = requests.get(
+        resp = HTTP_SESSION.get(
             f"{GOOGLE_DRIVE_API_BASE}/{doc_id}",
             headers=headers,
             params=params,
             timeout=REQUEST_TIMEOUT,
         )
-        data = resp.json() if resp.text else {}
+        data = load_json_text(resp.content) if resp.content else {}
     except Exception as exc:
         result = (False, "", f"Google Doc validation failed ({exc.__class__.__name__}: {exc})")
         if isinstance(cache, dict):
@@ -1624,14 +1770,7 @@ def cleanup_stale_doc_references(
         if prune_stale_doc_references_in_file(path, stale_urls):
             updated_files.append(str(path))
 
-    deduped_err: List[str] = []
-    seen_err: set[str] = set()
-    for item in stale_errors:
-        msg = normalize_space(item)
-        if not msg or msg in seen_err:
-            continue
-        seen_err.add(msg)
-        deduped_err.append(msg)
+    deduped_err = dedupe_messages(stale_errors)
 
     return {
         "ok": True,
@@ -1762,7 +1901,7 @@ def read_json_file_safely(path: Path) -> Any:
     try:
         if not path.exists():
             return None
-        return json.loads(path.read_text(encoding="utf-8"))
+        return load_json_text(path.read_bytes())
     except Exception:
         return None
 
@@ -1821,7 +1960,7 @@ def maybe_trigger_auto_review(
         return "script_missing"
 
     cmd = [
-        "/usr/bin/python3",
+        sys.executable or "/usr/bin/python3",
         str(script_path),
         "--reason",
         reason[:120],
@@ -1930,13 +2069,13 @@ def google_drive_find_existing_doc_by_source_url(source_url: str, limit: int = 8
         "fields": "files(id,name,webViewLink,modifiedTime)",
     }
     try:
-        resp = requests.get(
+        resp = HTTP_SESSION.get(
             f"{GOOGLE_DRIVE_API_BASE}",
             headers=headers,
             params=params,
             timeout=REQUEST_TIMEOUT,
         )
-        data = resp.json() if resp.text else {}
+        data = load_json_text(resp.content) if resp.content else {}
     except Exception as exc:
         return {"found": False}, f"Google Docs URL search failed ({exc.__class__.__name__}: {exc})"
     if resp.status_code >= 400:
@@ -1959,7 +2098,7 @@ def google_drive_find_existing_doc_by_source_url(source_url: str, limit: int = 8
 
         verified = False
         try:
-            export_resp = requests.get(
+            export_resp = HTTP_SESSION.get(
                 f"{GOOGLE_DRIVE_API_BASE}/{file_id}/export",
                 headers=headers,
                 params={"mimeType": "text/plain"},
@@ -2038,15 +2177,7 @@ def find_existing_recipe_doc_for_url(source_url: str, notes_root: Path) -> Dict[
     if drive_err:
         error_parts.append(drive_err)
     if error_parts:
-        seen_err: set[str] = set()
-        deduped: List[str] = []
-        for item in error_parts:
-            msg = normalize_space(item)
-            if not msg or msg in seen_err:
-                continue
-            seen_err.add(msg)
-            deduped.append(msg)
-        out["check_error"] = " | ".join(deduped)
+        out["check_error"] = " | ".join(dedupe_messages(error_parts))
     return out
 
 
@@ -2099,6 +2230,10 @@ def search_markdown_files_for_enquiry(query_text: str, root: Path, source_name:
     return out[:limit]
 
 
+SESSION_SUMMARY_FIELD_RE = re.compile(r'"summary"\s*:\s*"([^"]+)"')
+SESSION_TITLE_FIELD_RE = re.compile(r'"title"\s*:\s*"([^"]+)"')
+
+
 def search_session_history_for_enquiry(query_text: str, sessions_dir: Path, limit: int = 8) -> List[Dict[str, Any]]:
     if not is_accessible_dir(sessions_dir):
         return []
@@ -2115,11 +2250,11 @@ def search_session_history_for_enquiry(query_text: str, sessions_dir: Path, limi
         if score <= 0:
             continue
         title = ""
-        m = re.search(r'"summary"\s*:\s*"([^"]+)"', raw)
+        m = SESSION_SUMMARY_FIELD_RE.search(raw)
         if m:
             title = decode_html_text(m.group(1))
         if not title:
-            m = re.search(r'"title"\s*:\s*"([^"]+)"', raw)
+            m = SESSION_TITLE_FIELD_RE.search(raw)
         if m:
             title = decode_html_text(m.group(1))
         if not title:
@@ -2182,13 +2317,13 @@ def google_drive_search_docs(query_text: str, limit: int = 8) -> Tuple[List[Dict
         "fields": "files(id,name,webViewLink,modifiedTime)",
     }
     try:
-        resp = requests.get(
+        resp = HTTP_SESSION.get(
             f"{GOOGLE_DRIVE_API_BASE}",
             headers=headers,
             params=params,
             timeout=REQUEST_TIMEOUT,
         )
-        data = resp.json() if resp.text else {}
+        data = load_json_text(resp.content) if resp.content else {}
     except Exception as exc:
         return [], f"Google Docs search failed ({exc.__class__.__name__}: {exc})"
     if resp.status_code >= 400:
@@ -2384,20 +2519,23 @@ def infer_text_language_label(text: str) -> str:
     return "unknown"
 
 
+TEXT_RECIPE_TITLE_PATTERNS = [
+    re.compile(r"^(?:title|recipe title|dish|recipe name|name)\s*[:：]\s*(.+)$", flags=re.IGNORECASE),
+    re.compile(r"^(?:食譜名稱|菜名|料理名|名稱|名称|標題|标题)\s*[:：]\s*(.+)$", flags=re.IGNORECASE),
+    re.compile(r"^(?:レシピ名|タイトル)\s*[:：]\s*(.+)$", flags=re.IGNORECASE),
+    re.compile(r"^(?:요리 이름|레시피 이름|제목)\s*[:：]\s*(.+)$", flags=re.IGNORECASE),
+]
+NUMBERED_TITLE_LINE_RE = re.compile(r"^\d+[.)、:：-]")
+
+
 def extract_text_recipe_title(text: str) -> str:
     lines = [normalize_space(x) for x in text.splitlines() if normalize_space(x)]
     if not lines:
         return ""
 
-    title_patterns = [
-        r"^(?:title|recipe title|dish|recipe name|name)\s*[:：]\s*(.+)$",
-        r"^(?:食譜名稱|菜名|料理名|名稱|名称|標題|标题)\s*[:：]\s*(.+)$",
-        r"^(?:レシピ名|タイトル)\s*[:：]\s*(.+)$",
-        r"^(?:요리 이름|레시피 이름|제목)\s*[:：]\s*(.+)$",
-    ]
     for line in lines[:20]:
-        for pat in title_patterns:
-            m = re.match(pat, line, flags=re.IGNORECASE)
+        for pat in TEXT_RECIPE_TITLE_PATTERNS:
+            m = pat.match(line)
             if m:
                 return cleanup_title_text(m.group(1))
 
@@ -2413,7 +2551,7 @@ def extract_text_recipe_title(text: str) -> str:
             continue
         if len(line) > 140:
             continue
-        if re.match(r"^\d+[.)、:：-]", line):
+        if NUMBERED_TITLE_LINE_RE.match(line):
             continue
         return cleanup_title_text(line)
     return ""
@@ -2505,54 +2643,68 @@ def extract_source_payload_from_text(raw_text: str) -> Dict[str, Any]:
     return payload
 
 
-def extract_meta_content(html: str, key: str) -> str:
-    patterns = [
-        rf'<meta[^>]+(?:property|name)\s*=\s*["\']{re.escape(key)}["\'][^>]+content\s*=\s*["\']([^"\']+)["\']',
-        rf'<meta[^>]+content\s*=\s*["\']([^"\']+)["\'][^>]+(?:property|name)\s*=\s*["\']{re.escape(key)}["\']',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, html, flags=re.IGNORECASE)
-        if match:
-            return normalize_space(match.group(1))
-    return ""
+# Quote-aware: a ">" inside a quoted content value must not end the tag.
+META_TAG_RE = re.compile(r"""<meta\b(?:[^>"']|"[^"]*"|'[^']*')*>""", flags=re.IGNORECASE)
+HTML_ATTR_RE = re.compile(r"""([A-Za-z_:.-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+
+
+def collect_meta_tags(html: str) -> Dict[str, str]:
+    # One pass over all <meta> tags; first non-empty content wins per property/name key.
+    # A tag carrying both property= and name= is registered under each.
+    meta: Dict[str, str] = {}
+    for tag in META_TAG_RE.finditer(html or ""):
+        attrs: Dict[str, str] = {}
+        for attr in HTML_ATTR_RE.finditer(tag.group(0)):
+            attrs[attr.group(1).lower()] = attr.group(2) if attr.group(2) is not None else attr.group(3)
+        content = normalize_space(attrs.get("content", ""))
+        if not content:
+            continue
+        for key_attr in ("property", "name"):
+            key = (attrs.get(key_attr) or "").strip().lower()
+            if key and key not in meta:
+                meta[key] = content
+    return meta
 
 
 def strip_tags(text: str) -> str:
-    cleaned = re.sub(r"<[^>]+>", " ", text or "")
+    cleaned = HTML_TAG_RE.sub(" ", text or "")
     cleaned = cleaned.replace("&nbsp;", " ")
     return normalize_space(cleaned)
 
 
-def extract_title(html: str) -> str:
+HTML_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", flags=re.IGNORECASE | re.DOTALL)
+
+
+def extract_title(html: str, meta: Dict[str, str]) -> str:
     title_meta = first_non_empty(
         [
-            extract_meta_content(html, "og:title"),
-            extract_meta_content(html, "twitter:title"),
+            meta.get("og:title", ""),
+            meta.get("twitter:title", ""),
         ]
     )
     if title_meta:
         return title_meta
-    match = re.search(r"<title[^>]*>(.*?)</title>", html, flags=re.IGNORECASE | re.DOTALL)
+    match = HTML_TITLE_RE.search(html)
     if match:
         return strip_tags(match.group(1))
     return ""
 
 
-def extract_description(html: str) -> str:
+def extract_description(meta: Dict[str, str]) -> str:
     return first_non_empty(
         [
-            extract_meta_content(html, "og:description"),
-            extract_meta_content(html, "twitter:description"),
-            extract_meta_content(html, "description"),
+            meta.get("og:description", ""),
+            meta.get("twitter:description", ""),
+            meta.get("description", ""),
         ]
     )
 
 
-def extract_image_url(html: str, base_url: str) -> str:
+def extract_image_url(meta: Dict[str, str], base_url: str) -> str:
     raw = first_non_empty(
         [
-            extract_meta_content(html, "og:image"),
-            extract_meta_content(html, "twitter:image"),
+            meta.get("og:image", ""),
+            meta.get("twitter:image", ""),
         ]
     )
     if not raw:
@@ -2560,18 +2712,32 @@ def extract_image_url(html: str, base_url: str) -> str:
     return urljoin(base_url, decode_html_text(raw))
 
 
+def load_json_text(raw: Union[str, bytes]) -> Any:
+    # yt-dlp metadata, JSON-LD and API bodies can run to megabytes; orjson decodes them much faster.
+    # API responses are passed as raw bytes so the utf-8 decode into resp.text is skipped too.
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (NaN, lone surrogates); let json decide on sloppy page markup.
+            pass
+    return json.loads(raw)
+
+
+JSON_LD_SCRIPT_RE = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    flags=re.IGNORECASE | re.DOTALL,
+)
+
+
 def parse_json_ld_blocks(html: str) -> List[Any]:
     blocks: List[Any] = []
-    for match in re.finditer(
-        r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
-        html,
-        flags=re.IGNORECASE | re.DOTALL,
-    ):
+    for match in JSON_LD_SCRIPT_RE.finditer(html):
         raw = (match.group(1) or "").strip()
         if not raw:
             continue
         try:
-            blocks.append(json.loads(raw))
+            blocks.append(load_json_text(raw))
         except Exception:
             continue
     return blocks
@@ -2628,7 +2794,7 @@ def pick_video_obj(blocks: List[Any]) -> Dict[str, Any]:
 
 def has_meaningful_text(text: str, min_chars: int = 24) -> bool:
     clean = decode_html_text(text)
-    clean = re.sub(r"https?://\S+", "", clean).strip()
+    clean = BARE_URL_RE.sub("", clean).strip()
     return len(clean) >= min_chars
 
 
@@ -2646,13 +2812,13 @@ def is_video_source_url(url: str) -> bool:
     return False
 
 
-def is_video_source_page(url: str, html: str, json_ld_blocks: List[Any]) -> bool:
+def is_video_source_page(url: str, meta: Dict[str, str], json_ld_blocks: List[Any]) -> bool:
     if is_video_source_url(url):
         return True
-    og_type = extract_meta_content(html, "og:type").lower()
+    og_type = meta.get("og:type", "").lower()
     if "video" in og_type:
         return True
-    twitter_card = extract_meta_content(html, "twitter:card").lower()
+    twitter_card = meta.get("twitter:card", "").lower()
     if twitter_card in {"player", "video"}:
         return True
     if pick_video_obj(json_ld_blocks):
@@ -2673,6 +2839,9 @@ def extract_video_from_json_ld(video_obj: Dict[str, Any], base_url: str) -> Dict
     }
 
 
+JS_UNICODE_ESCAPE_RE = re.compile(r"\\u([0-9a-fA-F]{4})")
+
+
 def decode_js_escaped_text(value: str) -> str:
     if not value:
         return ""
@@ -2685,44 +2854,38 @@ def decode_js_escaped_text(value: str) -> str:
             return ""
 
     # Decode common JavaScript escapes found in embedded JSON blobs.
-    text = re.sub(r"\\u([0-9a-fA-F]{4})", _u4, text)
+    text = JS_UNICODE_ESCAPE_RE.sub(_u4, text)
     text = text.replace("\\n", "\n").replace("\\r", "\n").replace("\\t", " ")
     text = text.replace('\\"', '"').replace("\\/", "/").replace("\\\\", "\\")
     return normalize_multiline_text(text)
 
 
+YOUTUBE_VIDEO_TITLE_RE = re.compile(r'"videoDetails":\{.*?"title":"((?:[^"\\]|\\.)+)"', flags=re.DOTALL)
+YOUTUBE_SHORT_DESC_RE = re.compile(r'"shortDescription":"((?:[^"\\]|\\.)*)","isCrawlable"', flags=re.DOTALL)
+YOUTUBE_SHORT_DESC_FALLBACK_RE = re.compile(r'"shortDescription":"((?:[^"\\]|\\.)*)","thumbnail"', flags=re.DOTALL)
+YOUTUBE_THUMBNAIL_URL_RE = re.compile(r'"thumbnailUrl":"(https:[^"]+)"')
+
+
 def extract_youtube_fast_fields_from_html(html: str) -> Dict[str, str]:
     out: Dict[str, str] = {}
     if not html:
         return out
 
-    title_match = re.search(
-        r'"videoDetails":\{.*?"title":"((?:[^"\\]|\\.)+)"',
-        html,
-        flags=re.DOTALL,
-    )
+    title_match = YOUTUBE_VIDEO_TITLE_RE.search(html)
     if title_match:
         title = cleanup_title_text(decode_js_escaped_text(title_match.group(1)))
         if title:
             out["title"] = title
 
-    desc_match = re.search(
-        r'"shortDescription":"((?:[^"\\]|\\.)*)","isCrawlable"',
-        html,
-        flags=re.DOTALL,
-    )
+    desc_match = YOUTUBE_SHORT_DESC_RE.search(html)
     if not desc_match:
-        desc_match = re.search(
-            r'"shortDescription":"((?:[^"\\]|\\.)*)","thumbnail"',
-            html,
-            flags=re.DOTALL,
-        )
+        desc_match = YOUTUBE_SHORT_DESC_FALLBACK_RE.search(html)
     if desc_match:
         desc = decode_js_escaped_text(desc_match.group(1))
         if has_meaningful_text(desc, min_chars=20):
             out["description"] = desc
 
-    thumb_match = re.search(r'"thumbnailUrl":"(https:[^"]+)"', html)
+    thumb_match = YOUTUBE_THUMBNAIL_URL_RE.search(html)
     if thumb_match:
         out["thumbnail_url"] = decode_html_text(thumb_match.group(1).replace("\\/", "/"))
 
@@ -2762,7 +2925,7 @@ def fetch_video_metadata_with_ytdlp(url: str) -> Tuple[Dict[str, Any], str]:
     if not out:
         return {}, "yt-dlp metadata returned empty output"
     try:
-        data = json.loads(out)
+        data = load_json_text(out)
         return data if isinstance(data, dict) else {}, ""
     except Exception as exc:
         return {}, f"yt-dlp metadata parse failed ({exc.__class__.__name__}: {exc})"
@@ -2816,9 +2979,9 @@ def parse_caption_text(raw: str) -> str:
             continue
         if "-->" in cur:
             continue
-        if re.match(r"^\d+$", cur):
+        if cur.isdecimal():
             continue
-        cur = re.sub(r"<[^>]+>", " ", cur)
+        cur = HTML_TAG_RE.sub(" ", cur)
         cur = decode_html_text(cur)
         if not cur:
             continue
@@ -2837,7 +3000,7 @@ def fetch_caption_text(caption_url: str) -> Tuple[str, str]:
     if not caption_url:
         return "", "caption URL missing"
     try:
-        resp = requests.get(
+        resp = HTTP_SESSION.get(
             caption_url,
             headers={"User-Agent": USER_AGENT, "Accept": "text/vtt,text/plain,*/*"},
             timeout=REQUEST_TIMEOUT,
@@ -2921,7 +3084,7 @@ def transcribe_audio_with_openai(audio_path: str) -> Tuple[str, str]:
     try:
         with open(audio_path, "rb") as audio_file:
             files = {"file": (Path(audio_path).name, audio_file, "application/octet-stream")}
-            resp = requests.post(
+            resp = HTTP_SESSION.post(
                 OPENAI_TRANSCRIPTIONS_URL,
                 headers=headers,
                 data=data,
@@ -2937,7 +3100,7 @@ def transcribe_audio_with_openai(audio_path: str) -> Tuple[str, str]:
 
     if "application/json" in (resp.headers.get("Content-Type", "").lower()):
         try:
-            payload = resp.json()
+            payload = load_json_text(resp.content)
             text = str(payload.get("text", "")).strip() if isinstance(payload, dict) else ""
         except Exception:
             text = ""
@@ -3017,11 +3180,11 @@ def extract_recipe_from_json_ld(recipe_obj: Dict[str, Any], base_url: str) -> Di
     }
 
 
-def extract_main_text(html: str) -> str:
-    html = strip_comment_sections_html(html)
-    scrubbed = re.sub(r"<script[^>]*>.*?</script>", " ", html, flags=re.IGNORECASE | re.DOTALL)
-    scrubbed = re.sub(r"<style[^>]*>.*?</style>", " ", scrubbed, flags=re.IGNORECASE | re.DOTALL)
-    paragraphs = re.findall(r"<p[^>]*>(.*?)</p>", scrubbed, flags=re.IGNORECASE | re.DOTALL)
+HTML_PARAGRAPH_RE = re.compile(r"<p[^>]*>(.*?)</p>", flags=re.IGNORECASE | re.DOTALL)
+
+
+def extract_main_text(scrubbed_html: str) -> str:
+    paragraphs = HTML_PARAGRAPH_RE.findall(scrubbed_html)
     cleaned = [strip_tags(p) for p in paragraphs]
     filtered: List[str] = []
     for c in cleaned:
@@ -3039,11 +3202,135 @@ def extract_main_text(html: str) -> str:
     return joined[:4500]
 
 
-def fetch_page(url: str) -> Tuple[str, str]:
+def parse_html_once(html: str, base_url: str) -> Dict[str, Any]:
+    # Shared meta/scrub passes feed every extractor, instead of each re-scanning the raw page.
+    meta = collect_meta_tags(html)
+    scrubbed = scrub_html_for_text(html)
+    return {
+        "meta": meta,
+        "title": extract_title(html, meta),
+        "description": extract_description(meta),
+        "image_url": extract_image_url(meta, base_url),
+        "json_ld_blocks": parse_json_ld_blocks(html),
+        "main_text": extract_main_text(scrubbed),
+        "text_lines": html_to_text_lines(scrubbed),
+    }
+
+
+def fetch_page(url: str, etag: str = "", last_modified: str = "") -> Dict[str, Any]:
     headers = {"User-Agent": USER_AGENT, "Accept": "text/html,application/xhtml+xml"}
-    resp = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    resp = HTTP_SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+    if resp.status_code == 304:
+        return {"final_url": resp.url, "html": "", "not_modified": True, "etag": etag, "last_modified": last_modified}
     resp.raise_for_status()
-    return resp.url, resp.text
+    return {
+        "final_url": resp.url,
+        "html": resp.text,
+        "not_modified": False,
+        "etag": str(resp.headers.get("ETag", "")).strip(),
+        "last_modified": str(resp.headers.get("Last-Modified", "")).strip(),
+    }
+
+
+def page_cache_path() -> Path:
+    return Path(
+        read_env_value(
+            "CHIEF_FAFA_PAGE_CACHE_FILE",
+            "/home/felixlee/Desktop/chief-fafa/.pi/page_cache.json",
+        )
+    )
+
+
+@lru_cache(maxsize=1)
+def page_cache_extractor_version() -> str:
+    # Fingerprint of this script: an edited extractor (e.g. an auto-review VIDEO_URL_HINTS patch)
+    # must not keep serving payloads parsed by the old code just because the origin answers 304.
+    try:
+        return hashlib.sha1(Path(__file__).read_bytes()).hexdigest()[:12]
+    except OSError:
+        return "unknown"
+
+
+def page_cache_key(url: str) -> str:
+    mode = "fast" if is_fast_mode_enabled() else "full"
+    return f"{mode}|{page_cache_extractor_version()}|{url.strip()}"
+
+
+@lru_cache(maxsize=1)
+def load_page_cache_entries() -> Dict[str, Any]:
+    # Read once per run; store_page_cache_entry updates this same dict before writing it back.
+    data = read_json_file_safely(page_cache_path())
+    entries = data.get("entries", {}) if isinstance(data, dict) else {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def write_page_cache_entries(entries: Dict[str, Any]) -> None:
+    path = page_cache_path()
+    tmp_name = ""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Compact JSON via a temp file + os.replace so concurrent runs never see a half-written cache.
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=str(path.parent), prefix=".page_cache.", suffix=".tmp", delete=False
+        ) as fh:
+            tmp_name = fh.name
+            json.dump({"entries": entries}, fh, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    except Exception:
+        if tmp_name:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def store_page_cache_entry(url: str, page: Dict[str, Any], payload: Dict[str, Any]) -> None:
+    etag = str(page.get("etag", "")).strip()
+    last_modified = str(page.get("last_modified", "")).strip()
+    if not etag and not last_modified:
+        return
+    # Do not pin a partially enriched video payload behind a 304.
+    if str(payload.get("video_note", "")).strip():
+        return
+    entries = load_page_cache_entries()
+    # Entries parsed by an older extractor can never be hit again; drop them instead of waiting for eviction.
+    current = f"|{page_cache_extractor_version()}|"
+    for stale_key in [k for k in entries if current not in k]:
+        del entries[stale_key]
+    entries[page_cache_key(url)] = {
+        "etag": etag,
+        "last_modified": last_modified,
+        "payload": payload,
+        "ts": int(time.time()),
+    }
+    if len(entries) > PAGE_CACHE_MAX_ENTRIES:
+        newest = sorted(entries.items(), key=lambda kv: int(kv[1].get("ts", 0) or 0), reverse=True)
+        entries.clear()
+        entries.update(newest[:PAGE_CACHE_MAX_ENTRIES])
+    write_page_cache_entries(entries)
+
+
+def fetch_source_page(url: str) -> Dict[str, Any]:
+    cached = load_page_cache_entries().get(page_cache_key(url), {})
+    if not isinstance(cached, dict) or not isinstance(cached.get("payload"), dict):
+        cached = {}
+    page = fetch_page(
+        url,
+        etag=str(cached.get("etag", "")).strip(),
+        last_modified=str(cached.get("last_modified", "")).strip(),
+    )
+    if page.get("not_modified"):
+        if not cached:
+            raise RuntimeError("HTTP 304 without a cached page payload")
+        page["cached_payload"] = cached["payload"]
+        # Refresh ts on a hit so eviction drops the least recently used pages, not the oldest inserted.
+        cached["ts"] = int(time.time())
+        write_page_cache_entries(load_page_cache_entries())
+    return page
 
 
 def read_openai_text(payload: Dict[str, Any]) -> str:
@@ -3061,21 +3348,24 @@ def read_openai_text(payload: Dict[str, Any]) -> str:
     return "\n".join(texts).strip()
 
 
+JSON_OBJECT_SPAN_RE = re.compile(r"\{.*\}", flags=re.DOTALL)
+
+
 def parse_json_object_from_text(text: str) -> Dict[str, Any]:
     text = text.strip()
     if not text:
         return {}
     try:
-        parsed = json.loads(text)
+        parsed = load_json_text(text)
         if isinstance(parsed, dict):
             return parsed
     except Exception:
         pass
-    match = re.search(r"\{.*\}", text, flags=re.DOTALL)
+    match = JSON_OBJECT_SPAN_RE.search(text)
     if not match:
         return {}
     try:
-        parsed = json.loads(match.group(0))
+        parsed = load_json_text(match.group(0))
         return parsed if isinstance(parsed, dict) else {}
     except Exception:
         return {}
@@ -3104,7 +3394,7 @@ def call_openai_responses_json(system_prompt: str, user_prompt: str) -> Tuple[Di
 
     for attempt in range(max_retries + 1):
         try:
-            resp = requests.post(OPENAI_RESPONSES_URL, headers=headers, json=req_payload, timeout=timeout_sec)
+            resp = HTTP_SESSION.post(OPENAI_RESPONSES_URL, headers=headers, json=req_payload, timeout=timeout_sec)
             if resp.status_code in {429, 500, 502, 503, 504}:
                 detail = normalize_space(resp.text or "")
                 last_error = f"OpenAI HTTP {resp.status_code}: {detail[:220] or 'transient server error'}"
@@ -3112,7 +3402,7 @@ def call_openai_responses_json(system_prompt: str, user_prompt: str) -> Tuple[Di
                     time.sleep(OPENAI_RETRY_BACKOFF_SEC * (attempt + 1))
                     continue
             resp.raise_for_status()
-            parsed_data = resp.json()
+            parsed_data = load_json_text(resp.content)
             data = parsed_data if isinstance(parsed_data, dict) else {}
             last_error = ""
             break
@@ -3190,9 +3480,7 @@ def extract_text_recipe_with_openai(raw_text: str, language_hint: str) -> Tuple[
 def compact_payload_for_openai(payload: Dict[str, Any]) -> Dict[str, Any]:
     def clip(value: Any, limit: int) -> str:
         text = decode_html_text(str(value or ""))
-        if len(text) <= limit:
-            return text
-        return text[: limit - 3].rstrip() + "..."
+        return truncate_with_ellipsis(text, limit)
 
     ingredients = [clip(x, 200) for x in payload.get("ingredients", []) if str(x).strip()][:40]
     instructions = [clip(x, 320) for x in payload.get("instructions", []) if str(x).strip()][:40]
@@ -3318,11 +3606,18 @@ def resolve_google_client_secrets() -> Tuple[str, str]:
     return client_id, client_secret
 
 
+# Refreshed Docs access tokens, keyed by refresh token: (access_token, monotonic expiry).
+DOCS_TOKEN_CACHE: Dict[str, Tuple[str, float]] = {}
+
+
 def resolve_docs_access_token() -> Tuple[str, str]:
     refresh = read_env_value("GOOGLE_DOCS_REFRESH_TOKEN", read_env_value("GOOGLE_KEEP_REFRESH_TOKEN", ""))
     direct = read_env_value("GOOGLE_DOCS_ACCESS_TOKEN", read_env_value("GOOGLE_KEEP_ACCESS_TOKEN", ""))
 
     if refresh:
+        cached = DOCS_TOKEN_CACHE.get(refresh)
+        if cached and cached[1] > time.monotonic():
+            return cached[0], ""
         client_id, client_secret = resolve_google_client_secrets()
         if not client_id or not client_secret:
             # Fall back to direct token if available.
@@ -3337,11 +3632,16 @@ def resolve_docs_access_token() -> Tuple[str, str]:
             "grant_type": "refresh_token",
         }
         try:
-            resp = requests.post(GOOGLE_TOKEN_URL, data=payload, timeout=REQUEST_TIMEOUT)
+            resp = HTTP_SESSION.post(GOOGLE_TOKEN_URL, data=payload, timeout=REQUEST_TIMEOUT)
             resp.raise_for_status()
-            token_data = resp.json()
+            token_data = load_json_text(resp.content)
             access_token = str(token_data.get("access_token", "")).strip()
             if access_token:
+                try:
+                    expires_in = float(token_data.get("expires_in", 3600))
+                except (TypeError, ValueError):
+                    expires_in = 3600.0
+                DOCS_TOKEN_CACHE[refresh] = (access_token, time.monotonic() + max(0.0, expires_in - 60))
                 return access_token, ""
             refresh_error = "token refresh response missing access_token"
         except Exception as exc:
@@ -3392,13 +3692,16 @@ def guess_image_mime_and_name(image_url: str, content_type: str) -> Tuple[str, s
     return mime, filename
 
 
+YTIMG_VIDEO_ID_PATH_RE = re.compile(r"/vi(?:_webp)?/([^/]+)/")
+
+
 def extract_youtube_video_id_from_image_url(image_url: str) -> str:
     parsed = urlparse(image_url)
     host = parsed.netloc.lower()
     path = parsed.path
     if "ytimg.com" not in host and "youtube.com" not in host:
         return ""
-    match = re.search(r"/vi(?:_webp)?/([^/]+)/", path)
+    match = YTIMG_VIDEO_ID_PATH_RE.search(path)
     if match:
         return match.group(1).strip()
     return ""
@@ -3452,7 +3755,7 @@ def download_image_for_embed(image_url: str) -> Tuple[bytes, str, str, str]:
     last_err = "image download failed"
     for candidate in candidate_image_urls_for_embed(image_url):
         try:
-            resp = requests.get(
+            resp = HTTP_SESSION.get(
                 candidate,
                 headers={"User-Agent": USER_AGENT, "Accept": "image/*,*/*;q=0.8"},
                 timeout=REQUEST_TIMEOUT,
@@ -3517,8 +3820,8 @@ def upload_image_to_drive_for_embed(
         headers["X-Goog-User-Project"] = quota_project
 
     try:
-        resp = requests.post(GOOGLE_DRIVE_UPLOAD_URL, headers=headers, data=body, timeout=REQUEST_TIMEOUT)
-        data = resp.json() if resp.text else {}
+        resp = HTTP_SESSION.post(GOOGLE_DRIVE_UPLOAD_URL, headers=headers, data=body, timeout=REQUEST_TIMEOUT)
+        data = load_json_text(resp.content) if resp.content else {}
     except Exception as exc:
         return "", f"Drive upload failed ({exc.__class__.__name__}: {exc})"
 
@@ -3539,13 +3842,13 @@ def upload_image_to_drive_for_embed(
         perm_headers["X-Goog-User-Project"] = quota_project
     perm_payload = {"type": "anyone", "role": "reader", "allowFileDiscovery": False}
     try:
-        perm_resp = requests.post(
+        perm_resp = HTTP_SESSION.post(
             f"{GOOGLE_DRIVE_API_BASE}/{file_id}/permissions",
             headers=perm_headers,
             json=perm_payload,
             timeout=REQUEST_TIMEOUT,
         )
-        perm_data = perm_resp.json() if perm_resp.text else {}
+        perm_data = load_json_text(perm_resp.content) if perm_resp.content else {}
     except Exception as exc:
         return "", f"Drive permission failed ({exc.__class__.__name__}: {exc})"
 
@@ -3553,33 +3856,57 @@ def upload_image_to_drive_for_embed(
         detail = extract_google_api_error(perm_data)
         return "", f"Drive permission HTTP {perm_resp.status_code}: {detail or 'request failed'}"
 
-    return f"https://drive.google.com/uc?id={file_id}", ""
+    return file_id, ""
 
 
-def drive_image_uri_candidates(primary_uri: str) -> List[str]:
-    if not primary_uri:
+def drive_image_uri_candidates(file_id: str) -> List[str]:
+    clean = (file_id or "").strip()
+    if not clean:
         return []
-    out: List[str] = []
-    seen: set[str] = set()
+    return [
+        f"https://drive.google.com/uc?id={clean}",
+        f"https://drive.google.com/uc?export=view&id={clean}",
+        f"https://drive.google.com/thumbnail?id={clean}&sz=w1600",
+    ]
 
-    def add(uri: str) -> None:
-        clean = uri.strip()
-        if clean and clean not in seen:
-            seen.add(clean)
-            out.append(clean)
-
-    add(primary_uri)
-    parsed = urlparse(primary_uri)
-    file_id = ""
-    if parsed.query:
-        for part in parsed.query.split("&"):
-            if part.startswith("id="):
-                file_id = part.split("=", 1)[1].strip()
-                break
-    if file_id:
-        add(f"https://drive.google.com/uc?export=view&id={file_id}")
-        add(f"https://drive.google.com/thumbnail?id={file_id}&sz=w1600")
-    return out
+
+def wait_for_image_uri_public(
+    uri: str,
+    max_wait_sec: float = DRIVE_PUBLIC_POLL_MAX_SEC,
+    min_wait_sec: float = 0.0,
+) -> bool:
+    # Poll with exponential backoff until Drive serves the image, instead of a fixed sleep.
+    # A not-yet-public file redirects to the Google sign-in page (HTTP 200), so only an image body counts.
+    started = time.monotonic()
+    deadline = started + max(max_wait_sec, min_wait_sec)
+    delay = DRIVE_PUBLIC_POLL_START_SEC
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        try:
+            resp = HTTP_SESSION.head(
+                uri,
+                headers={"User-Agent": USER_AGENT},
+                allow_redirects=True,
+                # Never let a probe outlive the wait budget (the old fixed sleeps were 1.2s / 1.6s).
+                timeout=min(2.0, remaining),
+            )
+            content_type = str(resp.headers.get("Content-Type", "")).strip().lower()
+            final_host = (urlparse(resp.url or "").hostname or "").lower()
+            if resp.status_code < 400 and content_type.startswith("image/") and final_host != "accounts.google.com":
+                # HEAD cannot see what the Docs fetcher sees; keep the caller's minimum propagation delay.
+                floor = started + min_wait_sec - time.monotonic()
+                if floor > 0:
+                    time.sleep(floor)
+                return True
+        except Exception:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay *= 2
 
 
 def insert_image_into_doc(
@@ -3599,13 +3926,13 @@ def insert_image_into_doc(
     if insert_index is None:
         end_index = 1
         try:
-            get_resp = requests.get(
+            get_resp = HTTP_SESSION.get(
                 f"{DOCS_API_CREATE_URL}/{document_id}",
                 headers=headers,
                 params={"fields": "body/content/endIndex"},
                 timeout=REQUEST_TIMEOUT,
             )
-            get_data = get_resp.json() if get_resp.text else {}
+            get_data = load_json_text(get_resp.content) if get_resp.content else {}
             if get_resp.status_code < 400:
                 content = (((get_data or {}).get("body") or {}).get("content") or []) if isinstance(get_data, dict) else []
                 if isinstance(content, list) and content:
@@ -3629,13 +3956,13 @@ def insert_image_into_doc(
     }
 
     try:
-        batch_resp = requests.post(
+        batch_resp = HTTP_SESSION.post(
             f"{DOCS_API_CREATE_URL}/{document_id}:batchUpdate",
             headers=headers,
             json=batch_payload,
             timeout=REQUEST_TIMEOUT,
         )
-        batch_data = batch_resp.json() if batch_resp.text else {}
+        batch_data = load_json_text(batch_resp.content) if batch_resp.content else {}
     except Exception as exc:
         return f"Docs image insert failed ({exc.__class__.__name__}: {exc})"
 
@@ -3658,13 +3985,13 @@ def find_text_range_in_doc(
         "fields": "body/content(paragraph/elements(startIndex,endIndex,textRun/content))",
     }
     try:
-        resp = requests.get(
+        resp = HTTP_SESSION.get(
             f"{DOCS_API_CREATE_URL}/{document_id}",
             headers=headers,
             params=params,
             timeout=REQUEST_TIMEOUT,
         )
-        data = resp.json() if resp.text else {}
+        data = load_json_text(resp.content) if resp.content else {}
     except Exception:
         return -1, -1
     if resp.status_code >= 400 or not isinstance(data, dict):
@@ -3726,13 +4053,13 @@ def delete_text_range_in_doc(
         ]
     }
     try:
-        resp = requests.post(
+        resp = HTTP_SESSION.post(
             f"{DOCS_API_CREATE_URL}/{document_id}:batchUpdate",
             headers=headers,
             json=payload,
             timeout=REQUEST_TIMEOUT,
         )
-        data = resp.json() if resp.text else {}
+        data = load_json_text(resp.content) if resp.content else {}
     except Exception as exc:
         return f"Docs delete marker failed ({exc.__class__.__name__}: {exc})"
     if resp.status_code >= 400:
@@ -3764,13 +4091,13 @@ def insert_text_into_doc(
         ]
     }
     try:
-        resp = requests.post(
+        resp = HTTP_SESSION.post(
             f"{DOCS_API_CREATE_URL}/{document_id}:batchUpdate",
             headers=headers,
             json=payload,
             timeout=REQUEST_TIMEOUT,
         )
-        data = resp.json() if resp.text else {}
+        data = load_json_text(resp.content) if resp.content else {}
     except Exception as exc:
         return f"Docs insert text failed ({exc.__class__.__name__}: {exc})"
     if resp.status_code >= 400:
@@ -3785,6 +4112,12 @@ def create_google_doc_note(title: str, body: str, image_url: str = "") -> Dict[s
     if not token:
         return {"ok": False, "message": err or "missing Google Docs token"}
 
+    image_future: Optional[Future[Tuple[bytes, str, str, str]]] = None
+    if image_url and not fast_mode:
+        # Start the image download now so it overlaps the Docs create/insert round-trips below;
+        # an early Docs failure return just abandons it without delaying process exit.
+        image_future = start_background_task(download_image_for_embed, image_url)
+
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
     quota_project = read_env_value(
         "GOOGLE_DOCS_QUOTA_PROJECT",
@@ -3796,8 +4129,8 @@ def create_google_doc_note(title: str, body: str, image_url: str = "") -> Dict[s
     create_payload = {"title": title[:200]}
 
     try:
-        resp = requests.post(DOCS_API_CREATE_URL, headers=headers, json=create_payload, timeout=REQUEST_TIMEOUT)
-        data = resp.json() if resp.text else {}
+        resp = HTTP_SESSION.post(DOCS_API_CREATE_URL, headers=headers, json=create_payload, timeout=REQUEST_TIMEOUT)
+        data = load_json_text(resp.content) if resp.content else {}
     except Exception as exc:
         return {"ok": False, "message": f"Docs create failed ({exc.__class__.__name__}: {exc})"}
 
@@ -3823,13 +4156,13 @@ def create_google_doc_note(title: str, body: str, image_url: str = "") -> Dict[s
             ]
         }
         try:
-            batch_resp = requests.post(
+            batch_resp = HTTP_SESSION.post(
                 f"{DOCS_API_CREATE_URL}/{document_id}:batchUpdate",
                 headers=headers,
                 json=batch_payload,
                 timeout=REQUEST_TIMEOUT,
             )
-            batch_data = batch_resp.json() if batch_resp.text else {}
+            batch_data = load_json_text(batch_resp.content) if batch_resp.content else {}
         except Exception as exc:
             return {
                 "ok": False,
@@ -3900,8 +4233,8 @@ def create_google_doc_note(title: str, body: str, image_url: str = "") -> Dict[s
             image_embed_note = f" (fast mode: image unavailable - {insert_err})"
         else:
             image_embed_note = " (image embedded, fast mode)"
-    elif image_url:
-        image_bytes, mime_type, filename, download_err = download_image_for_embed(image_url)
+    elif image_future is not None:
+        image_bytes, mime_type, filename, download_err = image_future.result()
         if download_err:
             if marker_start > 0 and marker_end > marker_start:
                 delete_text_range_in_doc(
@@ -3925,15 +4258,13 @@ def create_google_doc_note(title: str, body: str, image_url: str = "") -> Dict[s
                 "url": doc_url,
             }
 
-        drive_uri, drive_err = upload_image_to_drive_for_embed(
+        drive_file_id, drive_err = upload_image_to_drive_for_embed(
             access_token=token,
             quota_project=quota_project,
             image_bytes=image_bytes,
             mime_type=mime_type,
             filename=filename,
         )
-        # Fallback: if Drive upload is unavailable (scope/quota), try embedding from source URI.
-        image_uri = drive_uri if not drive_err else image_url
         if marker_start > 0 and marker_end > marker_start:
             delete_err = delete_text_range_in_doc(
                 document_id=document_id,
@@ -3952,9 +4283,10 @@ def create_google_doc_note(title: str, body: str, image_url: str = "") -> Dict[s
             target_index = marker_start
         else:
             target_index = None
-        uri_candidates = [image_uri]
-        if drive_uri and not drive_err:
-            uri_candidates = drive_image_uri_candidates(drive_uri)
+        # Fallback: if Drive upload is unavailable (scope/quota), try embedding from source URI.
+        uri_candidates = [image_url]
+        if drive_file_id and not drive_err:
+            uri_candidates = drive_image_uri_candidates(drive_file_id)
         insert_err = ""
         for idx, uri_candidate in enumerate(uri_candidates):
             insert_err = insert_image_into_doc(
@@ -3968,11 +4300,11 @@ def create_google_doc_note(title: str, body: str, image_url: str = "") -> Dict[s
                 break
             is_retrieval_issue = "problem retrieving the image" in insert_err.casefold()
             if is_retrieval_issue and idx < (len(uri_candidates) - 1):
-                time.sleep(1.2)
+                wait_for_image_uri_public(uri_candidates[idx + 1], max_wait_sec=1.2)
                 continue
             if is_retrieval_issue and idx == (len(uri_candidates) - 1):
-                # One final retry after a short delay for Drive permission/index propagation.
-                time.sleep(1.6)
+                # One final retry once Drive permission/index propagation is visible.
+                wait_for_image_uri_public(uri_candidate, min_wait_sec=DRIVE_PUBLIC_FINAL_MIN_WAIT_SEC)
                 insert_err = insert_image_into_doc(
                     document_id=document_id,
                     access_token=token,
@@ -4016,8 +4348,11 @@ def create_google_doc_note(title: str, body: str, image_url: str = "") -> Dict[s
     return {"ok": True, "document_id": document_id, "url": doc_url, "message": f"created{image_embed_note}"}
 
 
+SLUG_SEPARATOR_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+
 def slugify(value: str) -> str:
-    raw = re.sub(r"[^a-zA-Z0-9]+", "-", value.strip().lower())
+    raw = SLUG_SEPARATOR_RE.sub("-", value.strip().lower())
     raw = raw.strip("-")
     return raw[:80] or "recipe"
 
@@ -4040,161 +4375,226 @@ def build_google_doc_recipe_text(source: Dict[str, Any], summary_text: str) -> s
         summary_text = f"Video recipe captured: {title}."
     summary_text = normalize_space(summary_text.replace("\n", " "))
     summary_text = strip_diagnostic_suffix(summary_text)
-    if len(summary_text) > 1400:
-        summary_text = summary_text[:1397].rstrip() + "..."
-
-    lines: List[str] = []
-    lines.append("Chief Fafa Recipe Note")
-    lines.append("")
-    lines.append(f"Recipe Title: {title}")
-    lines.append("")
-    lines.append("Original Page URL:")
+    summary_text = truncate_with_ellipsis(summary_text, 1400)
+
+    buf = io.StringIO()
+    w = buf.write
+    w("Chief Fafa Recipe Note\n")
+    w("\n")
+    w(f"Recipe Title: {title}\n")
+    w("\n")
+    w("Original Page URL:\n")
     if source_url:
-        lines.append(source_url)
+        w(f"{source_url}\n")
     elif is_text_recipe:
-        lines.append("(not provided; recipe submitted as text)")
+        w("(not provided; recipe submitted as text)\n")
     else:
-        lines.append("(missing)")
-    lines.append("")
+        w("(missing)\n")
+    w("\n")
     if is_text_recipe:
-        lines.append("Source Type:")
-        lines.append("Direct text input")
-        lines.append("")
+        w("Source Type:\n")
+        w("Direct text input\n")
+        w("\n")
         if input_language:
-            lines.append("Detected Language:")
-            lines.append(input_language)
-            lines.append("")
+            w("Detected Language:\n")
+            w(f"{input_language}\n")
+            w("\n")
     if is_video:
-        lines.append("Source Type:")
-        lines.append("Video link")
-        lines.append("")
-    lines.append("Recipe Summary:")
-    lines.append(summary_text or "(summary unavailable)")
-    lines.append("")
-    lines.append("Food Image:")
-    lines.append(DOC_IMAGE_MARKER)
-    lines.append("")
+        w("Source Type:\n")
+        w("Video link\n")
+        w("\n")
+    w("Recipe Summary:\n")
+    w(f"{summary_text or '(summary unavailable)'}\n")
+    w("\n")
+    w("Food Image:\n")
+    w(f"{DOC_IMAGE_MARKER}\n")
+    w("\n")
     if is_video and video_description:
-        lines.append("Video Description (from original source):")
-        lines.append(video_description)
-        lines.append("")
+        w("Video Description (from original source):\n")
+        w(f"{video_description}\n")
+        w("\n")
     if is_video and (not ingredients or not steps) and video_transcript:
-        lines.append("Transcript Excerpt (auto):")
-        lines.append(video_transcript)
-        lines.append("")
-    lines.append("Ingredients (from original source):")
+        w("Transcript Excerpt (auto):\n")
+        w(f"{video_transcript}\n")
+        w("\n")
+    w("Ingredients (from original source):\n")
     if ingredients:
         for item in ingredients:
-            lines.append(f"- {item}")
+            w(f"- {item}\n")
     else:
-        lines.append("- Not clearly detected from source.")
-    lines.append("")
-    lines.append("Method / Steps (from original source):")
+        w("- Not clearly detected from source.\n")
+    w("\n")
+    w("Method / Steps (from original source):\n")
     if steps:
         for idx, step in enumerate(steps, start=1):
-            lines.append(f"{idx}. {step}")
+            w(f"{idx}. {step}\n")
     else:
-        lines.append("1. Not clearly detected from source.")
-    lines.append("")
-    return "\n".join(lines).strip() + "\n"
+        w("1. Not clearly detected from source.\n")
+    w("\n")
+    return buf.getvalue().rstrip() + "\n"
+
+
+def report_timestamp() -> str:
+    now = dt.datetime.now(dt.timezone.utc)
+    return f"{now.year:04d}-{now.month:02d}-{now.day:02d} {now.hour:02d}:{now.minute:02d} UTC"
 
 
 def format_markdown_report(source: Dict[str, Any], summary_text: str, note_result: Dict[str, Any]) -> str:
-    lines: List[str] = []
-    lines.append(f"Chief Fafa Recipe Run - {dt.datetime.now(dt.timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}")
-    lines.append("")
-    lines.append(f"Content type: {source.get('content_type', '')}")
+    buf = io.StringIO()
+    w = buf.write
+    w(f"Chief Fafa Recipe Run - {report_timestamp()}\n")
+    w("\n")
+    w(f"Content type: {source.get('content_type', '')}\n")
     if source.get("input_language"):
-        lines.append(f"Detected language: {source.get('input_language')}")
-    lines.append(f"Title: {source.get('title', '')}")
-    lines.append(f"Source URL: {source.get('url', '')}")
-    lines.append(f"Ingredients detected: {len(source.get('ingredients', []) or [])}")
-    lines.append(f"Steps detected: {len(source.get('instructions', []) or [])}")
-    lines.append("")
-    lines.append("Summary:")
-    lines.append(summary_text or "")
-    lines.append("")
+        w(f"Detected language: {source.get('input_language')}\n")
+    w(f"Title: {source.get('title', '')}\n")
+    w(f"Source URL: {source.get('url', '')}\n")
+    w(f"Ingredients detected: {len(source.get('ingredients', []) or [])}\n")
+    w(f"Steps detected: {len(source.get('instructions', []) or [])}\n")
+    w("\n")
+    w("Summary:\n")
+    w(f"{summary_text or ''}\n")
+    w("\n")
     if note_result.get("ok"):
-        lines.append(f"Google Doc: OK ({note_result.get('url') or note_result.get('document_id') or 'created'})")
+        w(f"Google Doc: OK ({note_result.get('url') or note_result.get('document_id') or 'created'})\n")
     else:
-        lines.append(f"Google Doc: FAILED ({note_result.get('message', 'unknown error')})")
-    return "\n".join(lines).strip() + "\n"
+        w(f"Google Doc: FAILED ({note_result.get('message', 'unknown error')})\n")
+    return buf.getvalue().rstrip() + "\n"
 
 
 def format_enquiry_markdown_report(lookup: Dict[str, Any]) -> str:
-    lines: List[str] = []
-    lines.append(f"Chief Fafa Recipe Enquiry - {dt.datetime.now(dt.timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}")
-    lines.append("")
-    lines.append(f"Query: {lookup.get('query', '')}")
-    lines.append(f"Summary: {lookup.get('summary', '')}")
-    lines.append(f"Google Doc status: {lookup.get('google_doc_status', 'not_found')}")
-    lines.append(f"Google Doc URL: {lookup.get('google_doc_url', '')}")
+    buf = io.StringIO()
+    w = buf.write
+    w(f"Chief Fafa Recipe Enquiry - {report_timestamp()}\n")
+    w("\n")
+    w(f"Query: {lookup.get('query', '')}\n")
+    w(f"Summary: {lookup.get('summary', '')}\n")
+    w(f"Google Doc status: {lookup.get('google_doc_status', 'not_found')}\n")
+    w(f"Google Doc URL: {lookup.get('google_doc_url', '')}\n")
     if lookup.get("error_message"):
-        lines.append(f"Error: {lookup.get('error_message')}")
-    lines.append("")
-    lines.append("Matches:")
+        w(f"Error: {lookup.get('error_message')}\n")
+    w("\n")
+    w("Matches:\n")
     results = lookup.get("results", [])
     if isinstance(results, list) and results:
+        decode = decode_html_text
         for item in results[:8]:
-            title = decode_html_text(str(item.get("title", ""))).strip() or "Untitled"
+            title = decode(str(item.get("title", ""))) or "Untitled"
             source = str(item.get("source", "")).strip() or "unknown"
             doc_url = str(item.get("doc_url", "")).strip()
             source_url = str(item.get("source_url", "")).strip()
-            snippet = decode_html_text(str(item.get("snippet", ""))).strip()
-            lines.append(f"- [{source}] {title}")
+            snippet = decode(str(item.get("snippet", "")))
+            w(f"- [{source}] {title}\n")
             if doc_url:
-                lines.append(f"  Doc: {doc_url}")
+                w(f"  Doc: {doc_url}\n")
             if source_url:
-                lines.append(f"  Source: {source_url}")
+                w(f"  Source: {source_url}\n")
             if snippet:
-                lines.append(f"  Note: {snippet}")
+                w(f"  Note: {snippet}\n")
     else:
-        lines.append("- No matches")
-    return "\n".join(lines).strip() + "\n"
+        w("- No matches\n")
+    return buf.getvalue().rstrip() + "\n"
 
 
 def format_duplicate_markdown_report(hit: Dict[str, Any]) -> str:
-    lines: List[str] = []
-    lines.append(f"Chief Fafa Recipe Duplicate Check - {dt.datetime.now(dt.timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}")
-    lines.append("")
-    lines.append(f"Match type: {hit.get('match_type', '')}")
-    lines.append(f"Title: {hit.get('title', '')}")
-    lines.append(f"Source URL: {hit.get('source_url', '')}")
-    lines.append(f"Google Doc URL: {hit.get('doc_url', '')}")
+    buf = io.StringIO()
+    w = buf.write
+    w(f"Chief Fafa Recipe Duplicate Check - {report_timestamp()}\n")
+    w("\n")
+    w(f"Match type: {hit.get('match_type', '')}\n")
+    w(f"Title: {hit.get('title', '')}\n")
+    w(f"Source URL: {hit.get('source_url', '')}\n")
+    w(f"Google Doc URL: {hit.get('doc_url', '')}\n")
     if hit.get("note_path"):
-        lines.append(f"Note path: {hit.get('note_path', '')}")
+        w(f"Note path: {hit.get('note_path', '')}\n")
     if hit.get("summary"):
-        lines.append("")
-        lines.append("Summary:")
-        lines.append(str(hit.get("summary", "")))
-    return "\n".join(lines).strip() + "\n"
+        w("\n")
+        w("Summary:\n")
+        w(f"{hit.get('summary', '')}\n")
+    return buf.getvalue().rstrip() + "\n"
+
+
+def print_json(data: Any, pretty: bool = False, ascii_safe: bool = False) -> None:
+    if orjson is not None and not ascii_safe:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            encoded = orjson.dumps(data, option=option)
+        except orjson.JSONEncodeError:
+            encoded = b""
+        if encoded:
+            # orjson emits UTF-8 bytes; write them straight to the binary stdout buffer.
+            sys.stdout.flush()
+            sys.stdout.buffer.write(encoded + b"\n")
+            sys.stdout.buffer.flush()
+            return
+    if pretty:
+        print(json.dumps(data, ensure_ascii=ascii_safe, indent=2))
+    else:
+        print(json.dumps(data, ensure_ascii=ascii_safe, separators=(",", ":")))
+
 
+@lru_cache(maxsize=1)
+def report_run_stamp() -> str:
+    now = dt.datetime.now(dt.timezone.utc)
+    return f"{now.year:04d}{now.month:02d}{now.day:02d}-{now.hour:02d}{now.minute:02d}{now.second:02d}"
 
-def extract_source_payload(url: str) -> Dict[str, Any]:
-    final_url, html = fetch_page(url)
+
+def build_report_path(output_dir: Path, title: str) -> Path:
+    return output_dir / f"{report_run_stamp()}-{slugify(title)}.md"
+
+
+def emit_report(path: Path, report_markdown: str, echo: bool = False, fsync: bool = False) -> None:
+    # Encode once; the same bytes go to the report file and, in markdown mode, to stdout.
+    data = report_markdown.encode("utf-8")
+    pending = memoryview(data)
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while pending:
+            written = os.write(fd, pending)
+            pending = pending[written:]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    if echo:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data + b"\n" + f"Report saved: {path}\n".encode("utf-8"))
+        sys.stdout.buffer.flush()
+
+
+def extract_source_payload(url: str, page: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    if page is None:
+        page = fetch_source_page(url)
+    if isinstance(page.get("cached_payload"), dict):
+        return page["cached_payload"]
+    final_url = str(page.get("final_url", "")) or url
+    html = str(page.get("html", ""))
     domain = urlparse(final_url).netloc.lower()
     is_youtube_source = ("youtube.com" in domain) or ("youtu.be" in domain)
-    title = extract_title(html)
-    description = extract_description(html)
-    image_url = extract_image_url(html, final_url)
+    parsed = parse_html_once(html, final_url)
+    title = parsed["title"]
+    description = parsed["description"]
+    image_url = parsed["image_url"]
 
-    json_ld_blocks = parse_json_ld_blocks(html)
+    json_ld_blocks = parsed["json_ld_blocks"]
     recipe_obj = pick_recipe_obj(json_ld_blocks)
     recipe_fields = extract_recipe_from_json_ld(recipe_obj, final_url)
     video_obj = pick_video_obj(json_ld_blocks)
     video_fields = extract_video_from_json_ld(video_obj, final_url)
-    is_video_source = is_video_source_page(final_url, html, json_ld_blocks)
-    text_excerpt = extract_main_text(html)
-    text_lines = html_to_text_lines(html)
+    is_video_source = is_video_source_page(final_url, parsed["meta"], json_ld_blocks)
+    text_excerpt = parsed["main_text"]
+    text_lines = parsed["text_lines"]
     section_ingredients, section_steps = extract_sections_from_lines(text_lines)
     regex_ingredients, regex_steps = extract_sections_by_regex("\n".join(text_lines))
 
     all_ingredients = unique_clean_lines(
-        list(recipe_fields.get("ingredients", [])) + section_ingredients + regex_ingredients,
+        chain(recipe_fields.get("ingredients", []), section_ingredients, regex_ingredients),
         max_items=260,
     )
     all_steps = unique_clean_lines(
-        list(recipe_fields.get("instructions", [])) + section_steps + regex_steps,
+        chain(recipe_fields.get("instructions", []), section_steps, regex_steps),
         max_items=300,
     )
 
@@ -4233,14 +4633,14 @@ def extract_source_payload(url: str) -> Dict[str, Any]:
             )
         # Prefer extraction from description; only use transcript as fallback when missing.
         desc_ingredients, desc_steps = extract_recipe_sections_from_text_blob(video_description)
-        all_ingredients = unique_clean_lines(list(all_ingredients) + desc_ingredients, max_items=260)
-        all_steps = unique_clean_lines(list(all_steps) + desc_steps, max_items=320)
+        all_ingredients = unique_clean_lines(chain(all_ingredients, desc_ingredients), max_items=260)
+        all_steps = unique_clean_lines(chain(all_steps, desc_steps), max_items=320)
         if (not all_ingredients or not all_steps) and video_transcript:
             transcript_ingredients, transcript_steps = extract_recipe_sections_from_text_blob(video_transcript)
             if not all_ingredients:
-                all_ingredients = unique_clean_lines(list(all_ingredients) + transcript_ingredients, max_items=260)
+                all_ingredients = unique_clean_lines(chain(all_ingredients, transcript_ingredients), max_items=260)
             if not all_steps:
-                all_steps = unique_clean_lines(list(all_steps) + transcript_steps, max_items=320)
+                all_steps = unique_clean_lines(chain(all_steps, transcript_steps), max_items=320)
         video_blob = "\n\n".join([video_description, video_transcript]).strip()
         if not text_excerpt and video_blob:
             text_excerpt = video_blob[:2400]
@@ -4268,10 +4668,8 @@ def extract_source_payload(url: str) -> Dict[str, Any]:
 
     if "instagram.com" in domain and " on Instagram" in title:
         title = title.split(" on Instagram", 1)[0].strip()
-    if len(title) > 180:
-        title = title[:177].rstrip() + "..."
-    if len(description) > 800:
-        description = description[:797].rstrip() + "..."
+    title = truncate_with_ellipsis(title, 180)
+    description = truncate_with_ellipsis(description, 800)
 
     payload: Dict[str, Any] = {
         "url": final_url,
@@ -4293,6 +4691,7 @@ def extract_source_payload(url: str) -> Dict[str, Any]:
         "video_transcript": video_transcript if is_video_source else "",
         "video_note": video_note if is_video_source else "",
     }
+    store_page_cache_entry(url, page, payload)
     return payload
 
 
@@ -4312,6 +4711,13 @@ def main() -> None:
         action="store_true",
         help="When used with --json, output a compact payload for chat delivery",
     )
+    parser.add_argument("--pretty", action="store_true", help="Indent JSON output for human reading")
+    parser.add_argument("--fsync", action="store_true", help="fsync the saved markdown report before exiting")
+    parser.add_argument(
+        "--ascii-safe",
+        action="store_true",
+        help="Escape non-ASCII characters in JSON output (default emits UTF-8)",
+    )
     parser.add_argument(
         "--output-dir",
         default=read_env_value("CHIEF_FAFA_OUTPUT_DIR", "/home/felixlee/Desktop/chief-fafa/notes"),
@@ -4340,6 +4746,9 @@ def main() -> None:
         help="Extra markdown directory to clean (for example history/notes)",
     )
     args = parser.parse_args()
+    if not args.ascii_safe and hasattr(sys.stdout, "reconfigure"):
+        # JSON is emitted as UTF-8; lone surrogates from scraped text fall back to \uXXXX escapes.
+        sys.stdout.reconfigure(encoding="utf-8", errors="backslashreplace")
 
     raw_source = str(args.source or "").strip()
     if args.stdin:
@@ -4365,7 +4774,7 @@ def main() -> None:
             extra_dirs=extra_dirs,
         )
         if args.json:
-            print(json.dumps(cleanup_result, ensure_ascii=True, indent=2))
+            print_json(cleanup_result, pretty=args.pretty, ascii_safe=args.ascii_safe)
         else:
             lines = [
                 f"Cleanup status: {'ok' if cleanup_result.get('ok') else 'failed'}",
@@ -4403,11 +4812,9 @@ def main() -> None:
 
     if raw_source and looks_like_recipe_enquiry(raw_source):
         lookup = run_recipe_enquiry(raw_source, output_dir=output_dir)
-        stamp = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%d-%H%M%S")
-        slug = slugify(f"enquiry-{lookup.get('query', '')}")
-        report_path = output_dir / f"{stamp}-{slug}.md"
+        report_path = build_report_path(output_dir, f"enquiry-{lookup.get('query', '')}")
         report_markdown = format_enquiry_markdown_report(lookup)
-        report_path.write_text(report_markdown, encoding="utf-8")
+        emit_report(report_path, report_markdown, echo=not args.json, fsync=args.fsync)
 
         lookup_result = {
             "ok": bool(lookup.get("ok", True)),
@@ -4418,10 +4825,10 @@ def main() -> None:
         }
         if args.json:
             if args.json_brief:
-                summary = str(lookup.get("summary", "")).strip()
-                google_doc_status = str(lookup.get("google_doc_status", "not_found")).strip()
-                google_doc_url = str(lookup.get("google_doc_url", "")).strip()
-                error_message = str(lookup.get("error_message", "")).strip()
+                summary = dict_text(lookup, "summary")
+                google_doc_status = dict_text(lookup, "google_doc_status", "not_found")
+                google_doc_url = dict_text(lookup, "google_doc_url")
+                error_message = dict_text(lookup, "error_message")
                 brief = {
                     "ok": bool(lookup_result.get("ok")),
                     "summary": summary,
@@ -4438,24 +4845,25 @@ def main() -> None:
                     "auto_review_triggers": auto_review_triggers,
                     "report_path": str(report_path),
                 }
-                print(json.dumps(brief, ensure_ascii=True, indent=2))
+                print_json(brief, pretty=args.pretty, ascii_safe=args.ascii_safe)
             else:
-                print(json.dumps(lookup_result, ensure_ascii=True, indent=2))
-        else:
-            print(report_markdown)
-            print(f"Report saved: {report_path}")
+                print_json(lookup_result, pretty=args.pretty, ascii_safe=args.ascii_safe)
         return
 
+    page_future: Optional[Future[Dict[str, Any]]] = None
+    initial_dup: Dict[str, Any] = {}
     if initial_input_url and not args.no_doc and not args.no_keep:
+        # Download the page while the duplicate lookup runs; a duplicate hit just drops the result.
+        page_future = start_background_task(fetch_source_page, initial_input_url)
         initial_dup = find_existing_recipe_doc_for_url(initial_input_url, notes_root=output_dir)
-        if bool(initial_dup.get("found")) and str(initial_dup.get("doc_url", "")).strip():
-            dup_ok, dup_url, dup_err = validate_google_doc_url(str(initial_dup.get("doc_url", "")).strip())
+        if bool(initial_dup.get("found")) and dict_text(initial_dup, "doc_url"):
+            dup_ok, dup_url, dup_err = validate_google_doc_url(dict_text(initial_dup, "doc_url"))
             if not dup_ok or not dup_url:
                 initial_dup["found"] = False
-                initial_dup["stale_doc_url"] = str(initial_dup.get("doc_url", "")).strip()
+                initial_dup["stale_doc_url"] = dict_text(initial_dup, "doc_url")
                 initial_dup["doc_url"] = ""
                 if dup_err:
-                    prev = str(initial_dup.get("check_error", "")).strip()
+                    prev = dict_text(initial_dup, "check_error")
                     initial_dup["check_error"] = (
                         normalize_space(f"{prev} | duplicate doc validation failed: {dup_err}")
                         if prev
@@ -4464,12 +4872,10 @@ def main() -> None:
             else:
                 initial_dup["doc_url"] = dup_url
 
-        if bool(initial_dup.get("found")) and str(initial_dup.get("doc_url", "")).strip():
-            stamp = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%d-%H%M%S")
-            slug = slugify(f"duplicate-{initial_dup.get('title', 'recipe')}")
-            report_path = output_dir / f"{stamp}-{slug}.md"
+        if bool(initial_dup.get("found")) and dict_text(initial_dup, "doc_url"):
+            report_path = build_report_path(output_dir, f"duplicate-{initial_dup.get('title', 'recipe')}")
             report_markdown = format_duplicate_markdown_report(initial_dup)
-            report_path.write_text(report_markdown, encoding="utf-8")
+            emit_report(report_path, report_markdown, echo=not args.json, fsync=args.fsync)
 
             duplicate_summary = (
                 f"Recipe already exists for this URL. Reusing existing Google Doc: "
@@ -4479,17 +4885,17 @@ def main() -> None:
                 "ok": True,
                 "summary": duplicate_summary[:220],
                 "google_doc_status": "exists",
-                "google_doc_url": str(initial_dup.get("doc_url", "")).strip(),
+                "google_doc_url": dict_text(initial_dup, "doc_url"),
                 "error_message": "",
                 "reply_message": build_reply_message(
                     summary=duplicate_summary[:220],
                     google_doc_status="exists",
-                    google_doc_url=str(initial_dup.get("doc_url", "")).strip(),
+                    google_doc_url=dict_text(initial_dup, "doc_url"),
                     error_message="",
                 ),
                 "doc": {
                     "ok": True,
-                    "url": str(initial_dup.get("doc_url", "")).strip(),
+                    "url": dict_text(initial_dup, "doc_url"),
                     "message": "already exists; skipped duplicate creation",
                 },
                 "duplicate": initial_dup,
@@ -4497,10 +4903,7 @@ def main() -> None:
                 "report_path": str(report_path),
             }
             if args.json:
-                print(json.dumps(brief, ensure_ascii=True, indent=2))
-            else:
-                print(report_markdown)
-                print(f"Report saved: {report_path}")
+                print_json(brief, pretty=args.pretty, ascii_safe=args.ascii_safe)
             return
 
     if not raw_source:
@@ -4522,7 +4925,8 @@ def main() -> None:
         try:
             input_url = extract_first_url(raw_source)
             if input_url:
-                source = extract_source_payload(input_url)
+                prefetched_page = page_future.result() if page_future is not None else None
+                source = extract_source_payload(input_url, page=prefetched_page)
             else:
                 source = extract_source_payload_from_text(raw_source)
         except Exception as exc:
@@ -4545,7 +4949,7 @@ def main() -> None:
     if not isinstance(validation_missing, list):
         validation_missing = []
     validation_error = ""
-    if str(source.get("content_type", "")).strip().lower() == "text_recipe_input" and validation_missing:
+    if dict_text(source, "content_type").lower() == "text_recipe_input" and validation_missing:
         validation_error = f"text recipe missing required fields: {summarize_text_recipe_validation([str(x) for x in validation_missing])}"
 
     ai_err = ""
@@ -4568,11 +4972,21 @@ def main() -> None:
 
     duplicate_hit_post_fetch: Dict[str, Any] = {}
     duplicate_check_error = ""
-    if str(source.get("url", "")).strip() and not validation_error and not args.no_doc and not args.no_keep:
-        post_dup = find_existing_recipe_doc_for_url(str(source.get("url", "")), notes_root=output_dir)
-        if bool(post_dup.get("found")) and str(post_dup.get("doc_url", "")).strip():
+    if dict_text(source, "url") and not validation_error and not args.no_doc and not args.no_keep:
+        source_url = dict_text(source, "url")
+        if (
+            initial_dup
+            and not dict_text(initial_dup, "check_error")
+            and normalize_recipe_url(source_url) == normalize_recipe_url(initial_input_url)
+        ):
+            # Same URL as a clean pre-fetch check (no redirect): reuse its result instead of rescanning.
+            # A stale-doc note from that check must not leak into this run's errors, so those re-check.
+            post_dup = initial_dup
+        else:
+            post_dup = find_existing_recipe_doc_for_url(source_url, notes_root=output_dir)
+        if bool(post_dup.get("found")) and dict_text(post_dup, "doc_url"):
             duplicate_hit_post_fetch = post_dup
-        duplicate_check_error = str(post_dup.get("check_error", "")).strip()
+        duplicate_check_error = dict_text(post_dup, "check_error")
 
     note_result: Dict[str, Any] = {"ok": False, "message": "skipped"}
     if validation_error:
@@ -4580,7 +4994,7 @@ def main() -> None:
     elif duplicate_hit_post_fetch:
         note_result = {
             "ok": True,
-            "url": str(duplicate_hit_post_fetch.get("doc_url", "")).strip(),
+            "url": dict_text(duplicate_hit_post_fetch, "doc_url"),
             "message": "already exists; skipped duplicate creation",
         }
     elif not args.no_doc and not args.no_keep:
@@ -4589,7 +5003,7 @@ def main() -> None:
         note_result = create_google_doc_note(note_title, note_body, str(source.get("image_url", "")))
 
     doc_validation_error = ""
-    note_doc_url = str(note_result.get("url", "")).strip()
+    note_doc_url = dict_text(note_result, "url")
     if note_doc_url:
         ok, normalized_url, v_err = validate_google_doc_url(note_doc_url)
         if ok and normalized_url:
@@ -4607,10 +5021,8 @@ def main() -> None:
             doc_validation_error = reason
 
     report_markdown = format_markdown_report(source, summary_for_doc, note_result)
-    stamp = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%d-%H%M%S")
-    slug = slugify(str(source.get("title", "recipe")))
-    report_path = output_dir / f"{stamp}-{slug}.md"
-    report_path.write_text(report_markdown, encoding="utf-8")
+    report_path = build_report_path(output_dir, str(source.get("title", "recipe")))
+    emit_report(report_path, report_markdown, echo=not args.json, fsync=args.fsync)
 
     result = {
         "ok": True,
@@ -4636,7 +5048,7 @@ def main() -> None:
             doc_status = "ok" if bool(note_result.get("ok")) else "failed"
             if duplicate_hit_post_fetch:
                 doc_status = "exists"
-            doc_url = str(note_result.get("url", "")).strip()
+            doc_url = dict_text(note_result, "url")
             error_messages: List[str] = []
             if source_error:
                 error_messages.append(source_error)
@@ -4655,19 +5067,9 @@ def main() -> None:
                 error_messages.append(ai_err)
             if duplicate_check_error and not duplicate_hit_post_fetch:
                 error_messages.append(duplicate_check_error)
-            deduped_errors: List[str] = []
-            seen_errors: set[str] = set()
-            for item in error_messages:
-                msg = normalize_space(str(item))
-                if not msg:
-                    continue
-                if msg in seen_errors:
-                    continue
-                seen_errors.add(msg)
-                deduped_errors.append(msg)
-            error_message = " | ".join(deduped_errors).strip()
+            error_message = " | ".join(dedupe_messages(error_messages))
 
-            source_url_for_review = str(source.get("url", "")).strip() or initial_input_url
+            source_url_for_review = dict_text(source, "url") or initial_input_url
             if source_url_for_review and source_error:
                 trigger_state = maybe_trigger_auto_review(
                     reason="pipeline_error",
@@ -4732,12 +5134,9 @@ def main() -> None:
                 "auto_review_triggers": auto_review_triggers,
                 "report_path": str(report_path),
             }
-            print(json.dumps(brief, ensure_ascii=True, indent=2))
+            print_json(brief, pretty=args.pretty, ascii_safe=args.ascii_safe)
         else:
-            print(json.dumps(result, ensure_ascii=True, indent=2))
-    else:
-        print(report_markdown)
-        print(f"Report saved: {report_path}")
+            print_json(result, pretty=args.pretty, ascii_safe=args.ascii_safe)
 
 
 if __name__ == "__main__":
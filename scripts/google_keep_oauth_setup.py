@@ -14,9 +14,11 @@ from __future__ import annotations
 
 import argparse
 import json
+from typing import TYPE_CHECKING
 from urllib.parse import quote
 
-import requests
+if TYPE_CHECKING:
+    import requests
 
 AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
 TOKEN_URL = "https://oauth2.googleapis.com/token"
@@ -52,6 +54,27 @@ def build_auth_url(client_id: str, redirect_uri: str, scope: str, login_hint: st
     return f"{AUTH_URL}?{query}"
 
 
+def build_token_session() -> requests.Session:
+    # Imported lazily: only the --code step talks to the network.
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # An auth code is single-use: a read error or 5xx may come after Google already redeemed it,
+    # so only retry failed connects and explicit 429 throttling (rejected before redemption).
+    retry = Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.2,
+        status_forcelist=(429,),
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
+
 def exchange_code(client_id: str, client_secret: str, redirect_uri: str, code: str) -> dict:
     payload = {
         "code": code,
@@ -60,7 +83,8 @@ def exchange_code(client_id: str, client_secret: str, redirect_uri: str, code: s
         "redirect_uri": redirect_uri,
         "grant_type": "authorization_code",
     }
-    resp = requests.post(TOKEN_URL, data=payload, timeout=30)
+    with build_token_session() as session:
+        resp = session.post(TOKEN_URL, data=payload, timeout=30)
     resp.raise_for_status()
     data = resp.json()
     if not isinstance(data, dict):
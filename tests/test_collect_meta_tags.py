@@ -0,0 +1,28 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from chief_fafa_recipe_pipeline import collect_meta_tags  # noqa: E402
+
+
+class CollectMetaTagsTest(unittest.TestCase):
+    def test_gt_inside_quoted_content_is_kept(self):
+        html = (
+            '<head><meta property="og:title" content="Soup > Stew: a guide">'
+            "<meta name='description' content='Step 1 -> simmer'></head>"
+        )
+        meta = collect_meta_tags(html)
+        self.assertEqual(meta["og:title"], "Soup > Stew: a guide")
+        self.assertEqual(meta["description"], "Step 1 -> simmer")
+
+    def test_tag_with_property_and_name_registers_both_keys(self):
+        html = '<meta property="og:description" name="description" content="Crispy tofu">'
+        meta = collect_meta_tags(html)
+        self.assertEqual(meta["og:description"], "Crispy tofu")
+        self.assertEqual(meta["description"], "Crispy tofu")
+
+
+if __name__ == "__main__":
+    unittest.main()